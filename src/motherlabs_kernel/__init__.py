@@ -14,34 +14,96 @@ Key Principles:
 
 __version__ = "0.1.0"  # FROZEN - See KERNEL_FREEZE.md
 
-from .ambiguity import Proposer, resolve_ambiguity
-from .ambiguity_types import Interpretation
-from .artifacts_blueprint import BlueprintSpec
-from .artifacts_refusal import RefusalReport
-from .artifacts_verification import VerificationPack
-from .canonical import canonicalize
-from .commit_types import Commit
-from .dag import DAG
-from .dag_ids import edge_id, node_id
-from .dag_invariants import DAGInvariantError
-from .dag_types import Edge, EdgeKind, Node, NodeKind
-from .engine_types import RunResult
-from .hash import hash_canonical, sha256_hex
-from .ledger import Ledger
-from .ledger_types import EvidenceRecord
-from .ledger_validate import validate_chain
-from .policy import tie_break, validate_policy
-from .policy_types import Policy
-from .proposer_null import NullProposer
-from .proposer_recorded import RecordedProposer
-from .proposer_types import Proposer as ProposerProtocol
-from .proposal_types import Proposal
-from .replay import replay_from_ledger
-from .run_engine import run_engine
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Static view of _EXPORTS for type checkers (py.typed); not run at import
+    from .ambiguity import Proposer, resolve_ambiguity
+    from .ambiguity_types import Interpretation
+    from .artifacts_blueprint import BlueprintSpec
+    from .artifacts_refusal import RefusalReport
+    from .artifacts_verification import VerificationPack
+    from .canonical import canonicalize, canonicalize_into
+    from .commit_types import Commit
+    from .dag import DAG
+    from .dag_ids import edge_id, node_id
+    from .dag_invariants import DAGInvariantError
+    from .dag_types import Edge, EdgeKind, Node, NodeKind
+    from .engine_types import RunResult
+    from .hash import hash_canonical, hash_canonical_streaming, sha256_hex
+    from .ledger import Ledger
+    from .ledger_types import EvidenceRecord
+    from .ledger_validate import validate_chain
+    from .policy import tie_break, validate_policy
+    from .policy_types import Policy
+    from .proposer_null import NullProposer
+    from .proposer_recorded import RecordedProposer
+    from .proposer_types import Proposer as ProposerProtocol
+    from .proposal_types import Proposal
+    from .replay import replay_from_ledger
+    from .run_engine import run_engine
+
+# Public name -> (submodule, attribute). Submodules are imported on first
+# attribute access (PEP 562), so e.g. hash-only or replay-only callers do
+# not pay for importing the whole engine.
+_EXPORTS = {
+    "Proposer": (".ambiguity", "Proposer"),
+    "resolve_ambiguity": (".ambiguity", "resolve_ambiguity"),
+    "Interpretation": (".ambiguity_types", "Interpretation"),
+    "BlueprintSpec": (".artifacts_blueprint", "BlueprintSpec"),
+    "RefusalReport": (".artifacts_refusal", "RefusalReport"),
+    "VerificationPack": (".artifacts_verification", "VerificationPack"),
+    "canonicalize": (".canonical", "canonicalize"),
+    "canonicalize_into": (".canonical", "canonicalize_into"),
+    "Commit": (".commit_types", "Commit"),
+    "DAG": (".dag", "DAG"),
+    "edge_id": (".dag_ids", "edge_id"),
+    "node_id": (".dag_ids", "node_id"),
+    "DAGInvariantError": (".dag_invariants", "DAGInvariantError"),
+    "Edge": (".dag_types", "Edge"),
+    "EdgeKind": (".dag_types", "EdgeKind"),
+    "Node": (".dag_types", "Node"),
+    "NodeKind": (".dag_types", "NodeKind"),
+    "RunResult": (".engine_types", "RunResult"),
+    "hash_canonical": (".hash", "hash_canonical"),
+    "hash_canonical_streaming": (".hash", "hash_canonical_streaming"),
+    "sha256_hex": (".hash", "sha256_hex"),
+    "Ledger": (".ledger", "Ledger"),
+    "EvidenceRecord": (".ledger_types", "EvidenceRecord"),
+    "validate_chain": (".ledger_validate", "validate_chain"),
+    "tie_break": (".policy", "tie_break"),
+    "validate_policy": (".policy", "validate_policy"),
+    "Policy": (".policy_types", "Policy"),
+    "NullProposer": (".proposer_null", "NullProposer"),
+    "RecordedProposer": (".proposer_recorded", "RecordedProposer"),
+    "ProposerProtocol": (".proposer_types", "Proposer"),
+    "Proposal": (".proposal_types", "Proposal"),
+    "replay_from_ledger": (".replay", "replay_from_ledger"),
+    "run_engine": (".run_engine", "run_engine"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a public name lazily and cache it on the package."""
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "canonicalize",
+    "canonicalize_into",
     "hash_canonical",
+    "hash_canonical_streaming",
     "sha256_hex",
     "Ledger",
     "EvidenceRecord",
@@ -4,13 +4,12 @@ Autonomous ambiguity resolution protocol.
 Implements: expand → score → prune → collapse
 """
 
-from typing import List, Protocol
+from typing import List, Optional, Protocol
 
 from .ambiguity_types import Interpretation
 from .commit_types import Commit
-from .policy import tie_break
 from .policy_types import Policy
-from .prune import prune_interpretations
+from .prune import select_winner
 from .proposal_types import Proposal
 
 
@@ -41,7 +40,8 @@ def resolve_ambiguity(
     run_id: str,
     seed_hash: str,
     policy: Policy,
-    proposer: Proposer
+    proposer: Proposer,
+    proposal: Optional[Proposal[List[Interpretation]]] = None
 ) -> Commit[Interpretation]:
     """
     Resolve ambiguity autonomously: expand → score (cost) → prune → collapse.
@@ -61,6 +61,10 @@ def resolve_ambiguity(
         seed_hash: Hash of the seed text
         policy: Policy with max_interpretations limit
         proposer: Proposer that generates interpretations
+        proposal: Result of proposer.propose_interpretations(seed_hash,
+                  policy.max_interpretations) if the caller already has it
+                  (e.g. run_engine, which records it first); the proposer
+                  is then not queried again
         
     Returns:
         Commit containing the chosen interpretation
@@ -68,21 +72,21 @@ def resolve_ambiguity(
     Raises:
         ValueError: If proposer returns empty list or no valid interpretations
     """
-    # Expand: Get proposals
-    proposal = proposer.propose_interpretations(seed_hash, policy.max_interpretations)
+    # Expand: Get proposals (unless the caller already did)
+    if proposal is None:
+        proposal = proposer.propose_interpretations(seed_hash, policy.max_interpretations)
     interpretations = proposal.value
     
     if not interpretations:
         raise ValueError("Proposer returned empty interpretations list")
     
-    # Prune: Keep top K
-    pruned = prune_interpretations(interpretations, policy)
-    
-    if not pruned:
+    # Prune + collapse: the winner is what prune_interpretations would rank
+    # first; selecting it directly is an O(N) min instead of a sort to K
+    # Pruning keeps sorted(...)[:max_interpretations]: empty for 0, or for a
+    # negative limit that drops every interpretation
+    if not range(len(interpretations))[:policy.max_interpretations]:
         raise ValueError("No interpretations after pruning")
-    
-    # Collapse: Winner is first after prune
-    winner = pruned[0]
+    winner = select_winner(interpretations)
     
     # Commit: Create commit from winner
     commit = Commit.create(winner, accepted_from=proposal.proposal_hash)
@@ -12,7 +12,8 @@ class Interpretation:
     
     Fields:
         name: Unique name for this interpretation
-        assumptions: List of assumption strings (must not contain duplicates)
+        assumptions: Assumption strings (must not contain duplicates); any
+            iterable is accepted and stored as a tuple
         intent_summary: Summary of the intent for this interpretation
     
     Invariants (enforced at construction):
@@ -20,27 +21,33 @@ class Interpretation:
         - Violation raises ValueError (invalid input)
     """
     name: str
-    assumptions: list[str]
+    assumptions: tuple[str, ...]
     intent_summary: str
     
     def __post_init__(self):
         """
-        Validate assumptions list has no duplicates (exact string equality).
+        Freeze assumptions to a tuple and validate it has no duplicates
+        (exact string equality).
         
         Raises:
             ValueError: If assumptions list contains duplicate strings
         """
+        if type(self.assumptions) is not tuple:
+            object.__setattr__(self, 'assumptions', tuple(self.assumptions))
+        # Not sys.intern'ed: str hashes are already cached, interning measured slower
+        # set() is the fast no-duplicates check; the scan below only runs on error
         if len(self.assumptions) != len(set(self.assumptions)):
-            # Find duplicates for error message
+            # Find duplicates for error message (single pass); each repeated
+            # string is reported once, in order of its first repeat
             seen = set()
-            duplicates = []
+            duplicates = {}
             for assumption in self.assumptions:
                 if assumption in seen:
-                    duplicates.append(assumption)
+                    duplicates[assumption] = None
                 else:
                     seen.add(assumption)
             raise ValueError(
-                f"Interpretation '{self.name}' contains duplicate assumptions: {duplicates}. "
+                f"Interpretation '{self.name}' contains duplicate assumptions: {list(duplicates)}. "
                 "Assumptions list must not contain duplicates (exact string equality)."
             )
     
@@ -48,6 +55,6 @@ class Interpretation:
         """Convert to JSON-safe dict."""
         return {
             "name": self.name,
-            "assumptions": self.assumptions,
+            "assumptions": list(self.assumptions),
             "intent_summary": self.intent_summary
         }
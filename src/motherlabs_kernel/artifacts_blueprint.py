@@ -2,8 +2,8 @@
 BlueprintSpec artifact definition.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, List
+from dataclasses import dataclass
+from typing import Tuple
 
 from .hash import hash_canonical
 
@@ -15,13 +15,25 @@ class BlueprintSpec:
     
     This is the primary output artifact when the engine successfully
     converges. It contains all information needed to build the system.
+    
+    invariants and module_contracts are stored as tuples (lists are
+    accepted and frozen); to_json() returns a fresh dict with lists.
+    pinned_target and the module_contracts dicts stay mutable, so
+    compute_hash() hashes the current to_json() on every call.
     """
     run_id: str
     seed_hash: str
     intent_root_node_id: str
     pinned_target: dict
-    invariants: List[str]
-    module_contracts: List[dict] = field(default_factory=list)
+    invariants: Tuple[str, ...]
+    module_contracts: Tuple[dict, ...] = ()
+    
+    def __post_init__(self):
+        """Freeze sequence fields to tuples."""
+        if type(self.invariants) is not tuple:
+            object.__setattr__(self, 'invariants', tuple(self.invariants))
+        if type(self.module_contracts) is not tuple:
+            object.__setattr__(self, 'module_contracts', tuple(self.module_contracts))
     
     def compute_hash(self) -> str:
         """Compute hash of this blueprint spec."""
@@ -34,6 +46,6 @@ class BlueprintSpec:
             "seed_hash": self.seed_hash,
             "intent_root_node_id": self.intent_root_node_id,
             "pinned_target": self.pinned_target,  # Already JSON-safe
-            "invariants": self.invariants,
-            "module_contracts": self.module_contracts  # Already JSON-safe
+            "invariants": list(self.invariants),
+            "module_contracts": list(self.module_contracts)  # Already JSON-safe
         }
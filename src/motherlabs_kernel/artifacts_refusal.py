@@ -2,8 +2,8 @@
 RefusalReport artifact definition.
 """
 
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
+from typing import Tuple
 
 
 @dataclass(frozen=True, slots=True)
@@ -13,14 +13,23 @@ class RefusalReport:
     
     The kernel must refuse rather than guess when it cannot achieve
     convergence within policy limits.
+    
+    Sequence fields are stored as tuples (lists are accepted and frozen).
     """
     run_id: str
     seed_hash: str
-    reason_codes: List[str]
-    evidence_record_hashes: List[str]
-    policy_suggestions: List[str]
+    reason_codes: Tuple[str, ...]
+    evidence_record_hashes: Tuple[str, ...]
+    policy_suggestions: Tuple[str, ...]
     status: str = "refused"
     
+    def __post_init__(self):
+        """Freeze sequence fields to tuples."""
+        for name in ('reason_codes', 'evidence_record_hashes', 'policy_suggestions'):
+            value = getattr(self, name)
+            if type(value) is not tuple:
+                object.__setattr__(self, name, tuple(value))
+    
     def to_json(self) -> dict:
         """Convert to JSON-safe dict."""
         return {
@@ -38,6 +38,10 @@ class VerificationPack:
         }
         return hash_canonical(summary_data)
     
+    def is_consistent(self) -> bool:
+        """Check that expected_summary_hash matches the pack's current fields."""
+        return self.compute_summary_hash() == self.expected_summary_hash
+    
     def to_json(self) -> dict:
         """Convert to JSON-safe dict."""
         return {
@@ -4,10 +4,18 @@ Canonical JSON serialization for absolute determinism.
 This module provides canonical serialization that ensures identical inputs
 produce identical byte outputs, regardless of dict key order or other
 non-deterministic factors.
+
+The encoder is pure Python on purpose: the package ships no compiled
+extensions, and this module's output defines the frozen canonical bytes
+(see KERNEL_FREEZE.md), so there is no second (C/Cython) implementation
+that could drift from it.
 """
 
-import json
-from typing import Any
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, List, Union
+
+# Flush threshold (buffered fragments) for canonicalize_into
+_STREAM_CHUNK_FRAGMENTS = 4096
 
 
 def canonicalize(value: Any) -> bytes:
@@ -31,56 +39,222 @@ def canonicalize(value: Any) -> bytes:
         TypeError: If value contains non-JSON-safe types
         ValueError: If value contains NaN or Inf floats
     """
-    _validate_json_safe(value)
-    # Use separators=(',', ':') to remove all whitespace
-    # sort_keys=True ensures dict keys are sorted lexicographically
-    json_str = json.dumps(
-        value,
-        sort_keys=True,
-        separators=(',', ':'),
-        ensure_ascii=False
-    )
-    return json_str.encode('utf-8')
+    value_type = type(value)
+    if value_type is not dict:
+        # Top-level scalars (e.g. seed text) skip the fragment list and join.
+        # Floats keep the general path for the NaN/Inf checks.
+        if value_type is str:
+            return encode_basestring(value).encode('utf-8')
+        if value_type is int:
+            return int.__repr__(value).encode('ascii')
+        if value is None:
+            return b'null'
+        if value_type is bool:
+            return b'true' if value else b'false'
+    out: List[str] = []
+    _encode(value, out)
+    return ''.join(out).encode('utf-8')
 
 
-def _validate_json_safe(value: Any) -> None:
+def canonicalize_into(value: Any, write: Callable[[bytes], Any]) -> None:
     """
-    Recursively validate that value is JSON-safe.
+    Stream the canonical JSON bytes of value to write in chunks.
     
+    Produces exactly the bytes canonicalize(value) would, but never builds
+    the full buffer. The top-level container is walked item by item with
+    the regular encoder; buffered fragments are joined and flushed to write
+    (e.g. a hashlib object's update) once roughly _STREAM_CHUNK_FRAGMENTS
+    have accumulated, so peak memory is bounded by the largest top-level
+    item rather than the whole value. Chunks split between fragments, so
+    each one is complete UTF-8.
+    
+    Args:
+        value: JSON-safe value to canonicalize
+        write: Callable receiving successive UTF-8 byte chunks
+        
     Raises:
         TypeError: If value contains non-JSON-safe types
         ValueError: If value contains NaN or Inf floats
     """
-    if value is None:
-        return
-    if isinstance(value, bool):
-        return
-    if isinstance(value, int):
-        return
-    if isinstance(value, float):
-        # Reject NaN and Inf
-        if not (value == value):  # NaN check
-            raise ValueError("NaN is not allowed in canonical JSON")
-        if value == float('inf') or value == float('-inf'):
-            raise ValueError("Inf is not allowed in canonical JSON")
-        return
-    if isinstance(value, str):
-        return
-    if isinstance(value, (list, tuple)):
+    value_type = type(value)
+    encoder = _ENCODERS.get(value_type)
+    if encoder is None:
+        encoder = _resolve_encoder(value_type)
+    
+    out: List[str] = []
+    if encoder is _encode_list:
+        out.append('[')
+        first = True
         for item in value:
-            _validate_json_safe(item)
-        return
-    if isinstance(value, dict):
-        for key, val in value.items():
-            if not isinstance(key, str):
-                raise TypeError(f"Dict keys must be strings, got {type(key).__name__}")
-            if key is None:
-                raise TypeError("Dict keys cannot be None")
-            _validate_json_safe(val)
-        return
+            if first:
+                first = False
+            else:
+                out.append(',')
+            _encode(item, out)
+            if len(out) >= _STREAM_CHUNK_FRAGMENTS:
+                _flush(out, write)
+        out.append(']')
+    elif encoder is _encode_dict:
+        _check_dict_keys(value)
+        out.append('{')
+        first = True
+        for key in sorted(value):
+            if first:
+                first = False
+            else:
+                out.append(',')
+            out.append(encode_basestring(key))
+            out.append(':')
+            _encode(value[key], out)
+            if len(out) >= _STREAM_CHUNK_FRAGMENTS:
+                _flush(out, write)
+        out.append('}')
+    else:
+        encoder(value, out)
+    _flush(out, write)
+
+
+def _flush(out: List[str], write: Callable[[bytes], Any]) -> None:
+    """Write buffered fragments as one UTF-8 chunk and clear the buffer."""
+    if out:
+        write(''.join(out).encode('utf-8'))
+        out.clear()
+
+
+def _encode(value: Any, out: List[str]) -> None:
+    """
+    Validate value and append its canonical JSON fragments to out.
+    
+    Validation and encoding happen in the same walk. Output matches
+    json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False):
+    strings go through json's encode_basestring, ints through int.__repr__,
+    floats through float.__repr__.
     
+    Common exact types are dispatched with identity checks on type(value);
+    anything else (bool, float, subclasses, rejected types) goes through the
+    _ENCODERS table, which _resolve_encoder fills once per type.
+    
+    Raises:
+        TypeError: If value contains non-JSON-safe types
+        ValueError: If value contains NaN or Inf floats
+    """
+    value_type = type(value)
+    # Exact-type fast paths, most frequent first (no isinstance ladder)
+    if value_type is str:
+        out.append(encode_basestring(value))
+    elif value_type is dict:
+        _encode_dict(value, out)
+    elif value_type is int:
+        out.append(int.__repr__(value))
+    elif value_type is list or value_type is tuple:
+        _encode_list(value, out)
+    elif value is None:
+        out.append('null')
+    else:
+        encoder = _ENCODERS.get(value_type)
+        if encoder is None:
+            encoder = _resolve_encoder(value_type)
+        encoder(value, out)
+
+
+def _encode_none(value: None, out: List[str]) -> None:
+    out.append('null')
+
+
+def _encode_bool(value: bool, out: List[str]) -> None:
+    out.append('true' if value else 'false')
+
+
+def _encode_int(value: int, out: List[str]) -> None:
+    out.append(int.__repr__(value))
+
+
+def _encode_float(value: float, out: List[str]) -> None:
+    # Reject NaN and Inf
+    if not (value == value):  # NaN check
+        raise ValueError("NaN is not allowed in canonical JSON")
+    if value == float('inf') or value == float('-inf'):
+        raise ValueError("Inf is not allowed in canonical JSON")
+    out.append(float.__repr__(value))
+
+
+def _encode_str(value: str, out: List[str]) -> None:
+    out.append(encode_basestring(value))
+
+
+def _encode_list(value: Union[list, tuple], out: List[str]) -> None:
+    out.append('[')
+    first = True
+    for item in value:
+        if first:
+            first = False
+        else:
+            out.append(',')
+        _encode(item, out)
+    out.append(']')
+
+
+def _check_dict_keys(value: dict) -> None:
+    for key in value:
+        if not isinstance(key, str):
+            raise TypeError(f"Dict keys must be strings, got {type(key).__name__}")
+        if key is None:
+            raise TypeError("Dict keys cannot be None")
+
+
+def _encode_dict(value: dict, out: List[str]) -> None:
+    _check_dict_keys(value)
+    out.append('{')
+    first = True
+    # Sort keys lexicographically
+    for key in sorted(value):
+        if first:
+            first = False
+        else:
+            out.append(',')
+        out.append(encode_basestring(key))
+        out.append(':')
+        _encode(value[key], out)
+    out.append('}')
+
+
+def _encode_rejected(value: Any, out: List[str]) -> None:
     # Reject all other types
     raise TypeError(
         f"Type {type(value).__name__} is not JSON-safe. "
         "Allowed types: None, bool, int, float, str, list, tuple, dict(str->value)"
     )
+
+
+# Exact-type dispatch table, extended lazily by _resolve_encoder for subclasses
+# and rejected types.
+_ENCODERS: Dict[type, Callable[[Any, List[str]], None]] = {
+    type(None): _encode_none,
+    bool: _encode_bool,
+    int: _encode_int,
+    float: _encode_float,
+    str: _encode_str,
+    list: _encode_list,
+    tuple: _encode_list,
+    dict: _encode_dict,
+}
+
+
+def _resolve_encoder(value_type: type) -> Callable[[Any, List[str]], None]:
+    """Resolve (and cache) the encoder for a type not in the table yet."""
+    if issubclass(value_type, bool):
+        encoder = _encode_bool
+    elif issubclass(value_type, int):
+        encoder = _encode_int
+    elif issubclass(value_type, float):
+        encoder = _encode_float
+    elif issubclass(value_type, str):
+        encoder = _encode_str
+    elif issubclass(value_type, (list, tuple)):
+        encoder = _encode_list
+    elif issubclass(value_type, dict):
+        encoder = _encode_dict
+    else:
+        encoder = _encode_rejected
+    _ENCODERS[value_type] = encoder
+    return encoder
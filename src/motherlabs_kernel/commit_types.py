@@ -5,7 +5,17 @@ Type definitions for Commit (authoritative, deterministic).
 from dataclasses import dataclass
 from typing import Any, Generic, Optional, TypeVar
 
-from .hash import hash_canonical
+from .canonical import canonicalize
+from .hash import sha256_hex
+from .json_kinds import (
+    KIND_FLOAT,
+    KIND_MAPPING,
+    KIND_PRIMITIVE,
+    KIND_SEQUENCE,
+    KIND_TO_JSON,
+    TO_JSON_SAFE_KINDS,
+    classify,
+)
 
 T = TypeVar('T')
 
@@ -53,16 +63,17 @@ class Commit(Generic[T]):
         # Convert value to JSON-safe for hashing
         json_safe_value = cls._to_json_safe(value)
         
-        # Build dict matching .to_json() structure (excluding commit_hash)
-        # This ensures hash is computed from exact same dict that .to_json() returns
-        hashable_dict = {
-            "value": json_safe_value,
-            "accepted_from": accepted_from  # Include None if None (matches pydantic)
-            # Note: commit_hash is excluded from hash (it's the result)
-        }
-        
-        # Compute hash from this dict (exact same structure as .to_json() minus commit_hash)
-        commit_hash = hash_canonical(hashable_dict)
+        # Hash the canonical form of the dict matching .to_json() structure
+        # (excluding commit_hash, which is the result):
+        # {"value": json_safe_value, "accepted_from": accepted_from}, with
+        # accepted_from included even when None (matches pydantic). As in
+        # Proposal.create, the fixed-schema bytes are assembled around the
+        # encoded fields; the bytes are identical.
+        commit_hash = sha256_hex(b''.join((
+            b'{"accepted_from":', canonicalize(accepted_from),
+            b',"value":', canonicalize(json_safe_value),
+            b'}',
+        )))
         
         return cls(
             value=value,  # Store original value (objects, not dicts)
@@ -83,21 +94,38 @@ class Commit(Generic[T]):
         Raises:
             TypeError: If value contains unsupported types (sets, unknown containers)
         """
+        # Dispatch on type(value): one dict lookup instead of hasattr/isinstance probes
+        kind = TO_JSON_SAFE_KINDS.get(type(value))
+        if kind is None:
+            kind = classify(type(value))
+        
+        # JSON-safe primitives: None, bool, int, str
+        if kind == KIND_PRIMITIVE:
+            return value
+        
         # If it has a .to_json() method, use it
-        if hasattr(value, 'to_json') and callable(getattr(value, 'to_json', None)):
+        if kind == KIND_TO_JSON:
             return value.to_json()
         
         # Handle lists and tuples (preserve order)
-        if isinstance(value, (list, tuple)):
+        if kind == KIND_SEQUENCE:
             return [Commit._to_json_safe(item) for item in value]
         
         # Handle dicts (JSON-safe only: str keys)
-        if isinstance(value, dict):
+        if kind == KIND_MAPPING:
             for key in value.keys():
                 if not isinstance(key, str):
                     raise TypeError(f"Dict keys must be strings, got {type(key).__name__}")
             return {k: Commit._to_json_safe(v) for k, v in value.items()}
         
+        if kind == KIND_FLOAT:
+            # Reject NaN/Inf
+            if value != value:  # NaN check
+                raise ValueError("NaN is not allowed in canonical JSON")
+            if value == float('inf') or value == float('-inf'):
+                raise ValueError("Inf is not allowed in canonical JSON")
+            return value
+        
         # Reject sets explicitly (not JSON-safe, no order)
         if isinstance(value, (set, frozenset)):
             raise TypeError(f"Sets are not JSON-safe: {type(value).__name__}")
@@ -106,18 +134,6 @@ class Commit(Generic[T]):
         if isinstance(value, (bytes, bytearray)):
             raise TypeError(f"Bytes are not JSON-safe: {type(value).__name__}")
         
-        # JSON-safe primitives: None, bool, int, float, str
-        if value is None or isinstance(value, (bool, int, str)):
-            return value
-        
-        if isinstance(value, float):
-            # Reject NaN/Inf
-            if value != value:  # NaN check
-                raise ValueError("NaN is not allowed in canonical JSON")
-            if value == float('inf') or value == float('-inf'):
-                raise ValueError("Inf is not allowed in canonical JSON")
-            return value
-        
         # Reject all other types
         raise TypeError(
             f"Type {type(value).__name__} is not JSON-safe. "
@@ -126,7 +142,7 @@ class Commit(Generic[T]):
     
     def to_json(self) -> dict:
         """Convert to JSON-safe dict."""
-        # Convert value to JSON-safe if needed
+        # Convert value to JSON-safe on each call (a cached form would be shared)
         json_safe_value = self._to_json_safe(self.value)
         
         return {
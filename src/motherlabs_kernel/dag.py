@@ -2,17 +2,16 @@
 Authoritative DAG with deterministic IDs and invariants.
 """
 
-from typing import Any, Dict, List, Optional, Set
+import sys
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from .dag_ids import edge_id, node_id
 from .dag_invariants import (
     DAGInvariantError,
-    check_cycles,
-    check_duplicate_node_ids,
-    check_edge_node_references,
-    check_self_contradiction_edges,
+    TopologicalOrder,
+    check_self_contradiction_edge,
 )
-from .dag_types import Edge, EdgeKind, Node, NodeKind
+from .dag_types import EDGE_TAG_REFINES, Edge, EdgeKind, Node, NodeKind
 from .hash import hash_canonical
 
 
@@ -21,13 +20,27 @@ class DAG:
     Authoritative DAG with deterministic IDs and invariant enforcement.
     
     The DAG maintains nodes and edges with deterministic IDs computed
-    from their content. All invariants are enforced:
+    from their content. Hex IDs are interned to dense int positions on
+    insertion; nodes and edges are stored in position-indexed lists and
+    the public API translates string IDs at the boundary. Since run_id is
+    fixed per DAG, the ID inputs ((kind, payload_hash) for nodes, (kind,
+    from_id, to_id) for edges) are also mapped to positions, so re-adding
+    existing content skips the ID hash.
+    
+    All invariants are enforced:
     - No duplicate node IDs with differing content
     - All edges reference existing nodes
     - No cycles for depends_on/refines edges
     - No self-contradiction edges
     """
     
+    __slots__ = (
+        'run_id', '_node_index', '_edge_index', '_node_keys', '_edge_keys',
+        '_nodes', '_edges', '_topological_order',
+        '_sorted_node_ids', '_sorted_edge_ids',
+        '_nodes_view', '_edges_view', '_node_ids_view',
+    )
+    
     def __init__(self, run_id: str):
         """
         Initialize DAG with a run ID.
@@ -36,8 +49,24 @@ class DAG:
             run_id: Unique run identifier for deterministic ID generation
         """
         self.run_id = run_id
-        self._nodes: Dict[str, Node] = {}
-        self._edges: Dict[str, Edge] = {}
+        # Interned ID tables: hex ID -> position in _nodes/_edges
+        self._node_index: Dict[str, int] = {}
+        self._edge_index: Dict[str, int] = {}
+        # ID inputs -> position, so repeated content skips node_id/edge_id
+        self._node_keys: Dict[Tuple[str, str], int] = {}
+        self._edge_keys: Dict[Tuple[str, str, str], int] = {}
+        self._nodes: List[Node] = []
+        self._edges: List[Edge] = []
+        # Online topological order of depends_on/refines edges (by node
+        # position), maintained incrementally for cycle checks
+        self._topological_order = TopologicalOrder()
+        # Sorted ID lists for the DAG root hash; caught up lazily on read
+        self._sorted_node_ids: List[str] = []
+        self._sorted_edge_ids: List[str] = []
+        # Read-only snapshots handed out by the getters; reset on mutation
+        self._nodes_view: Optional[Tuple[Node, ...]] = None
+        self._edges_view: Optional[Tuple[Edge, ...]] = None
+        self._node_ids_view: Optional[FrozenSet[str]] = None
     
     def add_node(self, kind: NodeKind, payload: Any) -> Node:
         """
@@ -58,12 +87,22 @@ class DAG:
             TypeError: If payload is not JSON-safe
             ValueError: If payload contains NaN/Inf
         """
+        # Kinds repeat across every node; intern so stored Nodes share one
+        # object even when kind strings come from deserialized input.
+        if type(kind) is str:
+            kind = sys.intern(kind)
         payload_hash = hash_canonical(payload)
+        content_key = (kind, payload_hash)
+        position = self._node_keys.get(content_key)
+        if position is not None:
+            # Same kind and payload hash: same ID, same content
+            return self._nodes[position]
         node_id_val = node_id(self.run_id, kind, payload_hash)
         
         # Check for duplicate with different content
-        if node_id_val in self._nodes:
-            existing = self._nodes[node_id_val]
+        position = self._node_index.get(node_id_val)
+        if position is not None:
+            existing = self._nodes[position]
             if existing.kind != kind or existing.payload_hash != payload_hash:
                 raise DAGInvariantError(
                     f"Duplicate node ID {node_id_val} with differing content"
@@ -78,7 +117,11 @@ class DAG:
             payload=payload,
             payload_hash=payload_hash
         )
-        self._nodes[node_id_val] = node
+        self._node_index[node_id_val] = self._node_keys[content_key] = len(self._nodes)
+        self._nodes.append(node)
+        self._topological_order.add_node()
+        self._nodes_view = None
+        self._node_ids_view = None
         
         return node
     
@@ -89,6 +132,10 @@ class DAG:
         Computes deterministic edge ID from run_id, kind, from_id, and to_id.
         Validates that both nodes exist.
         
+        Invariants are checked incrementally: the graph is acyclic and free
+        of self-contradictions before the insert, so only the new edge can
+        violate them. A rejected edge is not stored.
+        
         Args:
             kind: Edge kind
             from_id: Source node ID
@@ -100,17 +147,28 @@ class DAG:
         Raises:
             DAGInvariantError: If nodes don't exist, cycle detected, or self-contradiction
         """
+        if type(kind) is str:
+            kind = sys.intern(kind)
+        # Already added (its nodes exist and it passed the invariants)
+        edge_key = (kind, from_id, to_id)
+        position = self._edge_keys.get(edge_key)
+        if position is not None:
+            return self._edges[position]
+        
         # Check nodes exist
-        if from_id not in self._nodes:
+        from_position = self._node_index.get(from_id)
+        if from_position is None:
             raise DAGInvariantError(f"Source node {from_id} does not exist")
-        if to_id not in self._nodes:
+        to_position = self._node_index.get(to_id)
+        if to_position is None:
             raise DAGInvariantError(f"Target node {to_id} does not exist")
         
         edge_id_val = edge_id(self.run_id, kind, from_id, to_id)
         
         # Check for duplicate (same ID = same edge, allowed)
-        if edge_id_val in self._edges:
-            return self._edges[edge_id_val]
+        position = self._edge_index.get(edge_id_val)
+        if position is not None:
+            return self._edges[position]
         
         # Create new edge
         edge = Edge(
@@ -119,45 +177,103 @@ class DAG:
             from_id=from_id,
             to_id=to_id
         )
-        self._edges[edge_id_val] = edge
         
-        # Check invariants after adding edge
-        self._check_invariants()
+        # Check invariants for the new edge only, before storing it; the
+        # order takes the edge only if it does not close a cycle, and a
+        # rejected from_id -> to_id closes one through from_id (to_id
+        # reaches it), so the error names from_id as a node on the cycle
+        check_self_contradiction_edge(edge)
+        if edge.kind_tag <= EDGE_TAG_REFINES and \
+                not self._topological_order.insert_edge(from_position, to_position):
+            raise DAGInvariantError(
+                f"Cycle detected in DAG starting from node {from_id} "
+                f"(edge {edge_id_val})"
+            )
+        
+        self._edge_index[edge_id_val] = self._edge_keys[edge_key] = len(self._edges)
+        self._edges.append(edge)
+        self._edges_view = None
         
         return edge
     
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get a node by ID."""
-        return self._nodes.get(node_id)
+        position = self._node_index.get(node_id)
+        return None if position is None else self._nodes[position]
     
     def get_edge(self, edge_id: str) -> Optional[Edge]:
         """Get an edge by ID."""
-        return self._edges.get(edge_id)
+        position = self._edge_index.get(edge_id)
+        return None if position is None else self._edges[position]
     
-    def get_nodes(self) -> List[Node]:
-        """Get all nodes (immutable copy)."""
-        return list(self._nodes.values())
+    def get_nodes(self) -> Tuple[Node, ...]:
+        """
+        Get all nodes in insertion order (immutable snapshot).
+        
+        The snapshot is built once and reused until the next add_node.
+        """
+        if self._nodes_view is None:
+            self._nodes_view = tuple(self._nodes)
+        return self._nodes_view
     
-    def get_edges(self) -> List[Edge]:
-        """Get all edges (immutable copy)."""
-        return list(self._edges.values())
+    def get_edges(self) -> Tuple[Edge, ...]:
+        """
+        Get all edges in insertion order (immutable snapshot).
+        
+        The snapshot is built once and reused until the next add_edge.
+        """
+        if self._edges_view is None:
+            self._edges_view = tuple(self._edges)
+        return self._edges_view
     
-    def get_node_ids(self) -> Set[str]:
-        """Get set of all node IDs."""
-        return set(self._nodes.keys())
+    def get_node_ids(self) -> FrozenSet[str]:
+        """
+        Get all node IDs (immutable snapshot).
+        
+        The snapshot is built once and reused until the next add_node.
+        """
+        if self._node_ids_view is None:
+            self._node_ids_view = frozenset(self._node_index)
+        return self._node_ids_view
     
-    def _check_invariants(self) -> None:
+    def commit_payload(self) -> Dict[str, List[Dict[str, str]]]:
         """
-        Check all DAG invariants.
+        Describe the committed DAG state for the ledger 'commit' record.
         
-        Raises:
-            DAGInvariantError: If any invariant is violated
+        Returns:
+            {"nodes": [{id, kind}], "edges": [{id, kind, from, to}]} in
+            insertion order
+        """
+        return {
+            "nodes": [{"id": n.id, "kind": n.kind} for n in self._nodes],
+            "edges": [
+                {"id": e.id, "kind": e.kind, "from": e.from_id, "to": e.to_id}
+                for e in self._edges
+            ]
+        }
+    
+    def sorted_node_ids(self) -> Tuple[str, ...]:
         """
-        nodes = self.get_nodes()
-        edges = self.get_edges()
-        node_ids_set = self.get_node_ids()
+        Get all node IDs in sorted order.
         
-        check_duplicate_node_ids(nodes)
-        check_edge_node_references(edges, node_ids_set)
-        check_self_contradiction_edges(edges)
-        check_cycles(edges, node_ids_set)
+        The sorted list is kept between calls; IDs added since the last call
+        are appended and the list re-sorted, which timsort does as a merge
+        of the already-sorted run with the new tail (O(N + k log k) rather
+        than a full sort).
+        """
+        return _catch_up_sorted(self._sorted_node_ids, self._nodes)
+    
+    def sorted_edge_ids(self) -> Tuple[str, ...]:
+        """
+        Get all edge IDs in sorted order (maintained like sorted_node_ids).
+        """
+        return _catch_up_sorted(self._sorted_edge_ids, self._edges)
+
+
+def _catch_up_sorted(sorted_ids: List[str], items: List[Any]) -> Tuple[str, ...]:
+    """Add IDs of items appended since the last call to sorted_ids, keep it sorted."""
+    known = len(sorted_ids)
+    if known < len(items):
+        sorted_ids.extend(item.id for item in items[known:])
+        sorted_ids.sort()
+    return tuple(sorted_ids)
@@ -2,8 +2,10 @@
 Deterministic ID generation for DAG nodes and edges.
 """
 
+from json.encoder import encode_basestring
+
 from .dag_types import Edge, EdgeKind, Node, NodeKind
-from .hash import hash_canonical
+from .hash import hash_canonical, sha256_hex
 
 
 def node_id(run_id: str, kind: NodeKind, payload_hash: str) -> str:
@@ -23,6 +25,10 @@ def node_id(run_id: str, kind: NodeKind, payload_hash: str) -> str:
     - IDs are stable regardless of insertion order
     - Domain separation prevents ID collisions with edges
     
+    The domain dict has a fixed schema, so for str fields its canonical
+    bytes are built directly (keys already in sorted order) instead of
+    going through canonicalize; other field types fall back to it.
+    
     Args:
         run_id: Unique run identifier
         kind: Node kind
@@ -31,6 +37,14 @@ def node_id(run_id: str, kind: NodeKind, payload_hash: str) -> str:
     Returns:
         Deterministic SHA-256 hex node ID
     """
+    if type(run_id) is str and type(kind) is str and type(payload_hash) is str:
+        return sha256_hex((
+            '{"kind":' + encode_basestring(kind)
+            + ',"payload_hash":' + encode_basestring(payload_hash)
+            + ',"run_id":' + encode_basestring(run_id)
+            + ',"t":"node"}'
+        ).encode('utf-8'))
+    
     domain_data = {
         't': 'node',
         'run_id': run_id,
@@ -58,6 +72,9 @@ def edge_id(run_id: str, kind: EdgeKind, from_id: str, to_id: str) -> str:
     - IDs are stable regardless of insertion order
     - Domain separation prevents ID collisions with nodes
     
+    As in node_id, str fields take a specialized encoding of the
+    fixed-schema domain dict.
+    
     Args:
         run_id: Unique run identifier
         kind: Edge kind
@@ -67,6 +84,15 @@ def edge_id(run_id: str, kind: EdgeKind, from_id: str, to_id: str) -> str:
     Returns:
         Deterministic SHA-256 hex edge ID
     """
+    if type(run_id) is str and type(kind) is str and type(from_id) is str and type(to_id) is str:
+        return sha256_hex((
+            '{"from":' + encode_basestring(from_id)
+            + ',"kind":' + encode_basestring(kind)
+            + ',"run_id":' + encode_basestring(run_id)
+            + ',"t":"edge","to":' + encode_basestring(to_id)
+            + '}'
+        ).encode('utf-8'))
+    
     domain_data = {
         't': 'edge',
         'run_id': run_id,
@@ -2,9 +2,10 @@
 Invariant checking for the DAG.
 """
 
-from typing import Dict, List, Set
+from array import array
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
-from .dag_types import Edge, EdgeKind, Node
+from .dag_types import EDGE_TAG_CONTRADICTS, EDGE_TAG_REFINES, Edge, EdgeKind, Node
 
 
 class DAGInvariantError(Exception):
@@ -19,20 +20,18 @@ def check_duplicate_node_ids(nodes: List[Node]) -> None:
     Raises:
         DAGInvariantError: If duplicate IDs with different content are found
     """
-    seen: Dict[str, Node] = {}
+    # node ID -> (kind, payload_hash); one dict probe and one tuple compare per node
+    seen: Dict[str, Tuple[str, str]] = {}
     for node in nodes:
-        if node.id in seen:
-            existing = seen[node.id]
-            # Check if content differs
-            if (existing.kind != node.kind or 
-                existing.payload_hash != node.payload_hash):
-                raise DAGInvariantError(
-                    f"Duplicate node ID {node.id} with differing content: "
-                    f"existing={existing.kind}/{existing.payload_hash}, "
-                    f"new={node.kind}/{node.payload_hash}"
-                )
-        else:
-            seen[node.id] = node
+        signature = (node.kind, node.payload_hash)
+        existing = seen.setdefault(node.id, signature)
+        # Check if content differs
+        if existing is not signature and existing != signature:
+            raise DAGInvariantError(
+                f"Duplicate node ID {node.id} with differing content: "
+                f"existing={existing[0]}/{existing[1]}, "
+                f"new={node.kind}/{node.payload_hash}"
+            )
 
 
 def check_edge_node_references(edges: List[Edge], node_ids: Set[str]) -> None:
@@ -71,11 +70,24 @@ def check_self_contradiction_edges(edges: List[Edge]) -> None:
         DAGInvariantError: If a contradicts edge has from == to
     """
     for edge in edges:
-        if edge.kind == 'contradicts' and edge.from_id == edge.to_id:
-            raise DAGInvariantError(
-                f"Self-contradiction edge detected: {edge.id} "
-                f"(from={edge.from_id}, to={edge.to_id})"
-            )
+        check_self_contradiction_edge(edge)
+
+
+def check_self_contradiction_edge(edge: Edge) -> None:
+    """
+    Check a single edge for self-contradiction (from == to for contradicts).
+    
+    Args:
+        edge: Edge to check
+        
+    Raises:
+        DAGInvariantError: If a contradicts edge has from == to
+    """
+    if edge.kind_tag == EDGE_TAG_CONTRADICTS and edge.from_id == edge.to_id:
+        raise DAGInvariantError(
+            f"Self-contradiction edge detected: {edge.id} "
+            f"(from={edge.from_id}, to={edge.to_id})"
+        )
 
 
 def check_cycles(edges: List[Edge], node_ids: Set[str]) -> None:
@@ -86,7 +98,8 @@ def check_cycles(edges: List[Edge], node_ids: Set[str]) -> None:
     'contradicts' edges are ignored for cycle detection, as they represent
     conflicts, not derivation dependencies.
     
-    Uses DFS to detect cycles.
+    Uses an iterative three-color DFS over integer node indices (no
+    recursion, so deep chains cannot hit the recursion limit).
     
     Args:
         edges: List of edges to check
@@ -95,35 +108,219 @@ def check_cycles(edges: List[Edge], node_ids: Set[str]) -> None:
     Raises:
         DAGInvariantError: If a cycle is detected
     """
-    # Build adjacency list for depends_on and refines edges only
-    graph: Dict[str, List[str]] = {node_id: [] for node_id in node_ids}
+    # Index nodes once; adjacency holds ints, not ID strings
+    ordered_ids = list(node_ids)
+    id_to_idx: Dict[str, int] = {node_id: idx for idx, node_id in enumerate(ordered_ids)}
     
+    # Collect depends_on and refines edges only, as parallel index arrays
+    from_idxs: List[int] = []
+    to_idxs: List[int] = []
     for edge in edges:
-        if edge.kind in ('depends_on', 'refines'):
-            if edge.from_id in graph and edge.to_id in graph:
-                graph[edge.from_id].append(edge.to_id)
+        if edge.kind_tag <= EDGE_TAG_REFINES:
+            from_idx = id_to_idx.get(edge.from_id)
+            to_idx = id_to_idx.get(edge.to_id)
+            if from_idx is not None and to_idx is not None:
+                from_idxs.append(from_idx)
+                to_idxs.append(to_idx)
+    
+    start = _find_cycle_start(from_idxs, to_idxs, len(ordered_ids))
+    if start is not None:
+        raise DAGInvariantError(f"Cycle detected in DAG starting from node {ordered_ids[start]}")
+
+
+def _build_csr(
+    from_idxs: Sequence[int], to_idxs: Sequence[int], node_count: int
+) -> Tuple[array, array]:
+    """
+    Build a compressed sparse row adjacency from parallel edge arrays.
     
-    # DFS to detect cycles
-    visited: Set[str] = set()
-    rec_stack: Set[str] = set()
+    The neighbors of node u are indices[indptr[u]:indptr[u + 1]], in the
+    order their edges appeared. Both arrays are flat machine ints, so the
+    whole graph is two contiguous buffers instead of a list (of boxed
+    ints) per node.
     
-    def has_cycle(node: str) -> bool:
-        visited.add(node)
-        rec_stack.add(node)
-        
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                if has_cycle(neighbor):
-                    return True
-            elif neighbor in rec_stack:
+    Returns:
+        (indptr, indices) with len(indptr) == node_count + 1
+    """
+    # Out-degree per node, shifted by one, then prefix-summed into offsets
+    indptr = array('l', (0,)) * (node_count + 1)
+    for from_idx in from_idxs:
+        indptr[from_idx + 1] += 1
+    total = 0
+    for idx in range(node_count + 1):
+        total += indptr[idx]
+        indptr[idx] = total
+    
+    # Scatter targets into each node's slice, advancing a per-node fill offset
+    fill = indptr[:-1]
+    indices = array('l', (0,)) * len(to_idxs)
+    for from_idx, to_idx in zip(from_idxs, to_idxs):
+        position = fill[from_idx]
+        indices[position] = to_idx
+        fill[from_idx] = position + 1
+    return indptr, indices
+
+
+def _find_cycle_start(
+    from_idxs: Sequence[int], to_idxs: Sequence[int], node_count: int
+) -> Optional[int]:
+    """
+    Iterative three-color DFS over the CSR form of the given edges.
+    
+    Every node on a cycle has an outgoing edge, so DFS roots are only the
+    edge sources, taken in order of first appearance; the other nodes are
+    reached (if at all) as leaves.
+    
+    Returns:
+        Index of the DFS root whose traversal found a back edge, or None
+        if the graph is acyclic
+    """
+    indptr, indices = _build_csr(from_idxs, to_idxs, node_count)
+    
+    # 0 = white (unvisited), 1 = gray (on DFS path), 2 = black (done)
+    color = bytearray(node_count)
+    # Per-node read offset into indices: a frame resumes where it left off,
+    # so each neighbor slice is scanned once in total (O(V + E)).
+    cursor = indptr[:-1]
+    
+    # Check all nodes that have outgoing edges. The loop touches only ints,
+    # the bytearray and the flat arrays; the current frame (node, next
+    # offset, end offset) is kept in locals and written back to cursor only
+    # when descending, so a node's neighbors are scanned without a cursor
+    # read/write per edge. stack holds the ancestors of the current node; a
+    # plain list with bound append/pop is used on purpose: preallocating it
+    # to node_count measured no faster and costs O(V) memory even when the
+    # DFS stays shallow.
+    stack: List[int] = []
+    push = stack.append
+    pop = stack.pop
+    for start in from_idxs:
+        if color[start]:
+            continue
+        color[start] = 1
+        node = start
+        position = cursor[node]
+        end = indptr[node + 1]
+        while True:
+            if position == end:
+                # All neighbors done
+                color[node] = 2
+                if not stack:
+                    break
+                node = pop()
+                position = cursor[node]
+                end = indptr[node + 1]
+                continue
+            neighbor = indices[position]
+            position += 1
+            state = color[neighbor]
+            if state == 0:
+                if indptr[neighbor] == indptr[neighbor + 1]:
+                    # Sink: nothing to explore, finish it without a frame
+                    color[neighbor] = 2
+                    continue
+                color[neighbor] = 1
+                cursor[node] = position
+                push(node)
+                node = neighbor
+                position = cursor[node]
+                end = indptr[node + 1]
+            elif state == 1:
                 # Found back edge = cycle
-                return True
+                return start
+    return None
+
+
+class TopologicalOrder:
+    """
+    Online topological order of the depends_on/refines subgraph.
+    
+    Pearce-Kelly dynamic topological sort over dense int node positions.
+    Every node holds a distinct rank, and every inserted edge u -> v keeps
+    rank[u] < rank[v]. A new edge that already respects the order is
+    accepted in O(1). Otherwise only nodes ranked between rank[v] and
+    rank[u] can be involved: a forward search from v (bounded by rank[u])
+    finds a cycle iff it reaches u; if it does not, a backward search from
+    u (bounded by rank[v]) collects u's ancestors in that window, and the
+    two visited sets are given their combined ranks back, ancestors first.
+    
+    Used by DAG.add_edge as the incremental cycle check.
+    """
+    
+    __slots__ = ('_rank', '_successors', '_predecessors')
+    
+    def __init__(self):
+        self._rank: List[int] = []
+        self._successors: List[List[int]] = []
+        self._predecessors: List[List[int]] = []
+    
+    def add_node(self) -> int:
+        """Add a node (ranked after all others) and return its position."""
+        position = len(self._rank)
+        self._rank.append(position)
+        self._successors.append([])
+        self._predecessors.append([])
+        return position
+    
+    def insert_edge(self, from_position: int, to_position: int) -> bool:
+        """
+        Insert edge from_position -> to_position unless it closes a cycle.
+        
+        Returns:
+            True if the edge was inserted (order updated), False if it would
+            close a cycle (nothing changed)
+        """
+        rank = self._rank
+        upper = rank[from_position]
+        lower = rank[to_position]
+        # Equal ranks only for a self-loop, which _reorder rejects
+        if lower <= upper:
+            if not self._reorder(from_position, to_position, lower, upper):
+                return False
+        self._successors[from_position].append(to_position)
+        self._predecessors[to_position].append(from_position)
+        return True
+    
+    def _reorder(self, from_position: int, to_position: int, lower: int, upper: int) -> bool:
+        """Restore rank order for a back-pointing edge; False on a cycle."""
+        if from_position == to_position:
+            return False
+        rank = self._rank
+        
+        # Forward: descendants of to_position ranked below upper (anything
+        # ranked above upper cannot reach from_position)
+        forward = [to_position]
+        seen = {to_position}
+        stack = [to_position]
+        successors = self._successors
+        while stack:
+            node = stack.pop()
+            for neighbor in successors[node]:
+                if neighbor == from_position:
+                    return False
+                if rank[neighbor] < upper and neighbor not in seen:
+                    seen.add(neighbor)
+                    forward.append(neighbor)
+                    stack.append(neighbor)
+        
+        # Backward: ancestors of from_position ranked above lower
+        backward = [from_position]
+        seen = {from_position}
+        stack = [from_position]
+        predecessors = self._predecessors
+        while stack:
+            node = stack.pop()
+            for neighbor in predecessors[node]:
+                if rank[neighbor] > lower and neighbor not in seen:
+                    seen.add(neighbor)
+                    backward.append(neighbor)
+                    stack.append(neighbor)
         
-        rec_stack.remove(node)
-        return False
-    
-    # Check all nodes
-    for node_id in node_ids:
-        if node_id not in visited:
-            if has_cycle(node_id):
-                raise DAGInvariantError(f"Cycle detected in DAG starting from node {node_id}")
+        # Ancestors (in their current relative order), then descendants,
+        # take the pooled ranks in ascending order
+        backward.sort(key=rank.__getitem__)
+        forward.sort(key=rank.__getitem__)
+        pool = sorted([rank[node] for node in backward] + [rank[node] for node in forward])
+        for node, new_rank in zip(backward + forward, pool):
+            rank[node] = new_rank
+        return True
@@ -2,13 +2,26 @@
 Type definitions for the DAG (Directed Acyclic Graph).
 """
 
-from dataclasses import dataclass
-from typing import Any, Literal
+from dataclasses import dataclass, field
+from typing import Any, Dict, Literal
 
 
 NodeKind = Literal['seed', 'interpretation', 'assumption', 'claim', 'decision', 'artifact']
 EdgeKind = Literal['depends_on', 'refines', 'contradicts']
 
+# Small-int edge kind tags (Edge.kind_tag). Derivation kinds (the ones cycle
+# checks follow) sort first, so "is derivation" is kind_tag <= EDGE_TAG_REFINES.
+EDGE_TAG_DEPENDS_ON = 0
+EDGE_TAG_REFINES = 1
+EDGE_TAG_CONTRADICTS = 2
+EDGE_TAG_UNKNOWN = 3
+
+_EDGE_KIND_TAGS: Dict[str, int] = {
+    'depends_on': EDGE_TAG_DEPENDS_ON,
+    'refines': EDGE_TAG_REFINES,
+    'contradicts': EDGE_TAG_CONTRADICTS,
+}
+
 
 @dataclass(frozen=True, slots=True)
 class Node:
@@ -46,11 +59,20 @@ class Edge:
         kind: Edge kind (depends_on, refines, contradicts)
         from_id: Source node ID
         to_id: Target node ID
+    
+    kind_tag is derived from kind on construction (one of the EDGE_TAG_*
+    constants) so hot loops filter by an int compare; it is not part of
+    equality or the JSON form.
     """
     id: str
     kind: EdgeKind
     from_id: str
     to_id: str
+    kind_tag: int = field(default=EDGE_TAG_UNKNOWN, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Derive the int kind tag."""
+        object.__setattr__(self, 'kind_tag', _EDGE_KIND_TAGS.get(self.kind, EDGE_TAG_UNKNOWN))
     
     def to_json(self) -> dict:
         """Convert to JSON-safe dict."""
@@ -2,7 +2,7 @@
 Type definitions for engine run.
 """
 
-from typing import Any, List
+from typing import Any, List, Sequence
 
 from .ledger_types import EvidenceRecord
 
@@ -17,11 +17,13 @@ class RunResult:
         - artifacts: BlueprintSpec + VerificationPack OR RefusalReport
     """
     
+    __slots__ = ('ledger_records', 'dag_nodes', 'dag_edges', 'artifacts')
+    
     def __init__(
         self,
         ledger_records: List[EvidenceRecord],
-        dag_nodes: List[Any],  # Will be Node from dag_types
-        dag_edges: List[Any],  # Will be Edge from dag_types
+        dag_nodes: Sequence[Any],  # Will be Node from dag_types
+        dag_edges: Sequence[Any],  # Will be Edge from dag_types
         artifacts: Any  # Will be BlueprintSpec or RefusalReport
     ):
         self.ledger_records = ledger_records
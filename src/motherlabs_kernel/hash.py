@@ -3,9 +3,19 @@ SHA-256 hashing for deterministic hash computation.
 """
 
 import hashlib
+from json.encoder import encode_basestring
 from typing import Any, Union
 
-from .canonical import canonicalize
+from .canonical import canonicalize, canonicalize_into
+
+# OpenSSL-backed constructor (dispatches to SHA-NI / ARMv8 SHA when the CPU
+# has it); bound once to skip the module attribute lookup per hash.
+_sha256 = hashlib.sha256
+# No shared batch hasher: a hashlib object cannot be reset, and .copy() costs a new one
+
+# Containers with at least this many top-level items are streamed into the
+# hasher by hash_canonical instead of being materialized.
+_STREAM_MIN_ITEMS = 256
 
 
 def sha256_hex(data: Union[bytes, str]) -> str:
@@ -20,7 +30,8 @@ def sha256_hex(data: Union[bytes, str]) -> str:
     """
     if isinstance(data, str):
         data = data.encode('utf-8')
-    return hashlib.sha256(data).hexdigest().lower()
+    # hexdigest() is already lowercase
+    return _sha256(data).hexdigest()
 
 
 def hash_canonical(value: Any) -> str:
@@ -32,6 +43,45 @@ def hash_canonical(value: Any) -> str:
     same hash, regardless of dict key order or other non-deterministic
     factors.
     
+    Large containers (_STREAM_MIN_ITEMS or more top-level items) are
+    streamed into the hasher via hash_canonical_streaming, so their
+    canonical bytes are never materialized.
+    
+    Args:
+        value: JSON-safe value to hash
+        
+    Returns:
+        Lowercase hexadecimal string of SHA-256 hash of canonical JSON
+        
+    Raises:
+        TypeError: If value contains non-JSON-safe types
+        ValueError: If value contains NaN or Inf floats
+    """
+    value_type = type(value)
+    if value_type is str:
+        # Top-level strings (e.g. seed text): the canonical bytes are just
+        # the JSON string literal, so skip the size check and canonicalize
+        return _hash_bytes(encode_basestring(value).encode('utf-8'))
+    if (value_type is dict or value_type is list or value_type is tuple) \
+            and len(value) >= _STREAM_MIN_ITEMS:
+        return hash_canonical_streaming(value)
+    return _hash_bytes(canonicalize(value))
+
+
+def _hash_bytes(canonical_bytes: bytes) -> str:
+    """Hash canonical bytes."""
+    return _sha256(canonical_bytes).hexdigest()
+
+
+def hash_canonical_streaming(value: Any) -> str:
+    """
+    SHA-256 of canonical JSON, streamed into the hasher in chunks.
+    
+    Returns the same digest as hash_canonical(value) without materializing
+    the full canonical bytes, which bounds peak memory for large values
+    (module_contracts, artifact_hashes, big proposals). hash_canonical
+    routes large containers here automatically.
+    
     Args:
         value: JSON-safe value to hash
         
@@ -42,5 +92,6 @@ def hash_canonical(value: Any) -> str:
         TypeError: If value contains non-JSON-safe types
         ValueError: If value contains NaN or Inf floats
     """
-    canonical_bytes = canonicalize(value)
-    return sha256_hex(canonical_bytes)
+    hasher = _sha256()
+    canonicalize_into(value, hasher.update)
+    return hasher.hexdigest()
@@ -0,0 +1,33 @@
+"""
+Per-type dispatch kinds for the Proposal/Commit JSON-safe conversion.
+"""
+
+from typing import Dict
+
+KIND_TO_JSON = 0
+KIND_SEQUENCE = 1
+KIND_MAPPING = 2
+KIND_PRIMITIVE = 3
+KIND_FLOAT = 4
+KIND_REJECT = 5
+
+# type -> kind, filled in by classify
+TO_JSON_SAFE_KINDS: Dict[type, int] = {}
+
+
+def classify(value_type: type) -> int:
+    """Resolve and cache the _to_json_safe dispatch kind for a type."""
+    if callable(getattr(value_type, 'to_json', None)):
+        kind = KIND_TO_JSON
+    elif issubclass(value_type, (list, tuple)):
+        kind = KIND_SEQUENCE
+    elif issubclass(value_type, dict):
+        kind = KIND_MAPPING
+    elif value_type is type(None) or issubclass(value_type, (bool, int, str)):
+        kind = KIND_PRIMITIVE
+    elif issubclass(value_type, float):
+        kind = KIND_FLOAT
+    else:
+        kind = KIND_REJECT
+    TO_JSON_SAFE_KINDS[value_type] = kind
+    return kind
@@ -2,10 +2,12 @@
 In-memory, append-only evidence ledger with tamper-evident hash chaining.
 """
 
-from typing import Any, List, Optional
+import sys
+from operator import attrgetter
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
 from .hash import hash_canonical
-from .ledger_types import EvidenceRecord
+from .ledger_types import EvidenceRecord, compute_record_hash
 
 
 class Ledger:
@@ -17,6 +19,8 @@ class Ledger:
     chain. Once appended, records cannot be modified.
     """
     
+    __slots__ = ('_records',)
+    
     def __init__(self):
         """Initialize an empty ledger."""
         self._records: List[EvidenceRecord] = []
@@ -42,40 +46,47 @@ class Ledger:
             TypeError: If payload is not JSON-safe
             ValueError: If payload contains NaN/Inf
         """
-        # Compute payload hash
-        payload_hash = hash_canonical(payload)
-        
         # Get parent hash (previous record's record_hash)
         parent: Optional[str] = None
         if self._records:
             parent = self._records[-1].record_hash
         
-        # Compute record hash from metadata only (not full payload)
-        record_metadata = {
-            "v": 1,
-            "ts": ts,
-            "kind": kind,
-            "parent": parent,
-            "payload_hash": payload_hash
-        }
-        record_hash = hash_canonical(record_metadata)
-        
-        # Create immutable record
-        record = EvidenceRecord(
-            v=1,
-            ts=ts,
-            kind=kind,
-            parent=parent,
-            payload=payload,
-            payload_hash=payload_hash,
-            record_hash=record_hash
-        )
+        record = _build_record(ts, kind, payload, parent)
         
         # Append to ledger
         self._records.append(record)
         
         return record
     
+    def extend(self, entries: Iterable[Tuple[str, str, Any]]) -> List[EvidenceRecord]:
+        """
+        Append several evidence records in order.
+        
+        Equivalent to calling append(ts, kind, payload) for each entry, but
+        the parent hash is carried in a local instead of re-reading the last
+        record each time. Entries are validated as they are built; if one
+        fails, the records before it stay appended (as with append calls).
+        
+        Args:
+            entries: (ts, kind, payload) tuples in ledger order
+            
+        Returns:
+            The newly created records, in order
+            
+        Raises:
+            TypeError: If a payload is not JSON-safe
+            ValueError: If a payload contains NaN/Inf
+        """
+        records = self._records
+        parent: Optional[str] = records[-1].record_hash if records else None
+        appended: List[EvidenceRecord] = []
+        for ts, kind, payload in entries:
+            record = _build_record(ts, kind, payload, parent)
+            records.append(record)
+            appended.append(record)
+            parent = record.record_hash
+        return appended
+    
     def get_records(self) -> List[EvidenceRecord]:
         """
         Get all records in the ledger (immutable copy).
@@ -85,6 +96,33 @@ class Ledger:
         """
         return self._records.copy()
     
+    def iter_records(self) -> Iterator[EvidenceRecord]:
+        """
+        Iterate over records in order without copying.
+        
+        Use this instead of get_records() when only reading; records are
+        frozen, but the ledger must not be appended to while iterating.
+        
+        Returns:
+            Iterator over evidence records in order
+        """
+        return iter(self._records)
+    
+    def iter_record_hashes(self) -> Iterator[str]:
+        """
+        Iterate over record hashes in order without copying the records.
+        
+        Same ledger-must-not-grow-while-iterating rule as iter_records().
+        
+        Returns:
+            Iterator over record_hash values in order
+        """
+        return map(_record_hash, self._records)
+    
+    def __iter__(self) -> Iterator[EvidenceRecord]:
+        """Iterate over records in order (same as iter_records())."""
+        return iter(self._records)
+    
     def get_last_hash(self) -> Optional[str]:
         """
         Get the hash of the last record in the ledger.
@@ -99,3 +137,30 @@ class Ledger:
     def __len__(self) -> int:
         """Return the number of records in the ledger."""
         return len(self._records)
+
+
+_record_hash = attrgetter('record_hash')
+
+
+def _build_record(ts: str, kind: str, payload: Any, parent: Optional[str]) -> EvidenceRecord:
+    """Hash payload and metadata and build the record that follows parent."""
+    # Record kinds come from a small fixed set; intern so records share them
+    if type(kind) is str:
+        kind = sys.intern(kind)
+    
+    # Compute payload hash
+    payload_hash = hash_canonical(payload)
+    
+    # Compute record hash from metadata only (not full payload)
+    record_hash = compute_record_hash(1, ts, kind, parent, payload_hash)
+    
+    # Create immutable record
+    return EvidenceRecord(
+        v=1,
+        ts=ts,
+        kind=kind,
+        parent=parent,
+        payload=payload,
+        payload_hash=payload_hash,
+        record_hash=record_hash
+    )
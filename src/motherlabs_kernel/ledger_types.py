@@ -3,8 +3,11 @@ Type definitions for the evidence ledger.
 """
 
 from dataclasses import dataclass
+from json.encoder import encode_basestring
 from typing import Any, Optional
 
+from .hash import hash_canonical, sha256_hex
+
 
 @dataclass(frozen=True, slots=True)
 class EvidenceRecord:
@@ -43,3 +46,40 @@ class EvidenceRecord:
             "payload_hash": self.payload_hash,
             "record_hash": self.record_hash
         }
+
+
+def compute_record_hash(v: int, ts: str, kind: str, parent: Optional[str], payload_hash: str) -> str:
+    """
+    Compute record_hash from record metadata.
+    
+    record_hash = hash_canonical({
+        "v": v, "ts": ts, "kind": kind, "parent": parent, "payload_hash": payload_hash
+    })
+    
+    The metadata has a fixed schema, so for the usual field types (int v,
+    str fields, str-or-None parent) the canonical bytes are assembled
+    directly with the keys in sorted order; anything else falls back to
+    hash_canonical on the dict.
+    
+    Returns:
+        Lowercase hex SHA-256 record hash
+    """
+    if (type(v) is int and type(ts) is str and type(kind) is str
+            and type(payload_hash) is str and (parent is None or type(parent) is str)):
+        return sha256_hex((
+            '{"kind":' + encode_basestring(kind)
+            + ',"parent":' + ('null' if parent is None else encode_basestring(parent))
+            + ',"payload_hash":' + encode_basestring(payload_hash)
+            + ',"ts":' + encode_basestring(ts)
+            + ',"v":' + int.__repr__(v)
+            + '}'
+        ).encode('utf-8'))
+    
+    record_metadata = {
+        "v": v,
+        "ts": ts,
+        "kind": kind,
+        "parent": parent,
+        "payload_hash": payload_hash
+    }
+    return hash_canonical(record_metadata)
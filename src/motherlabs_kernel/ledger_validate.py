@@ -5,10 +5,10 @@ Validation functions for the evidence ledger.
 from typing import List
 
 from .hash import hash_canonical
-from .ledger_types import EvidenceRecord
+from .ledger_types import EvidenceRecord, compute_record_hash
 
 
-def validate_chain(records: List[EvidenceRecord]) -> bool:
+def validate_chain(records: List[EvidenceRecord], deep: bool = True) -> bool:
     """
     Validate the hash chain of evidence records.
     
@@ -21,8 +21,22 @@ def validate_chain(records: List[EvidenceRecord]) -> bool:
     - All record_hashes match
     - Parent linkage is correct (each record's parent matches previous record's record_hash)
     
+    Validation runs in passes ordered by cost, so tampering is rejected by
+    the cheapest check that can see it:
+    1. parent linkage (pure string comparisons)
+    2. record_hash from the small fixed-shape metadata
+    3. payload_hash from the canonicalized payload (deep only; this is
+       where nearly all the time goes)
+    
+    With deep=False the stored payload_hash is trusted and payloads are not
+    re-canonicalized; only the (small, fixed-shape) record metadata is
+    rehashed. That still detects any change to ts/kind/parent/payload_hash
+    and any broken linkage, but not a payload swapped under its old
+    payload_hash, so the default stays deep=True.
+    
     Args:
         records: List of evidence records to validate
+        deep: Also recompute payload_hash from each payload (default True)
         
     Returns:
         True if chain is valid, False otherwise
@@ -30,32 +44,26 @@ def validate_chain(records: List[EvidenceRecord]) -> bool:
     if not records:
         return True  # Empty chain is valid
     
-    for i, record in enumerate(records):
-        # Recompute payload hash
-        computed_payload_hash = hash_canonical(record.payload)
-        if computed_payload_hash != record.payload_hash:
-            return False
-        
-        # Determine expected parent
-        expected_parent: str | None = None
-        if i > 0:
-            expected_parent = records[i - 1].record_hash
-        
-        # Check parent linkage
+    # Pass 1: parent linkage (first record has no parent). Tracks the
+    # expected parent directly instead of zipping against a records[1:] copy.
+    expected_parent = None
+    for record in records:
         if record.parent != expected_parent:
             return False
-        
-        # Recompute record hash from metadata
-        record_metadata = {
-            "v": record.v,
-            "ts": record.ts,
-            "kind": record.kind,
-            "parent": record.parent,
-            "payload_hash": record.payload_hash
-        }
-        computed_record_hash = hash_canonical(record_metadata)
-        
+        expected_parent = record.record_hash
+    
+    # Pass 2: recompute record hashes from metadata
+    for record in records:
+        computed_record_hash = compute_record_hash(
+            record.v, record.ts, record.kind, record.parent, record.payload_hash
+        )
         if computed_record_hash != record.record_hash:
             return False
     
+    # Pass 3: recompute payload hashes
+    if deep:
+        for record in records:
+            if hash_canonical(record.payload) != record.payload_hash:
+                return False
+    
     return True
@@ -6,6 +6,18 @@ from typing import List
 
 from .policy_types import Policy
 
+# (field, minimum allowed value), checked in order by validate_policy
+_POLICY_MINIMUMS = (
+    ("max_interpretations", 1),
+    ("max_nodes", 1),
+    ("max_depth", 1),
+    ("contradiction_budget", 0),
+    ("max_steps", 1),
+)
+
+# Supported deterministic tie-break methods
+_TIEBREAK_METHODS = ('lexicographic',)
+
 
 def validate_policy(policy: Policy) -> None:
     """
@@ -25,22 +37,12 @@ def validate_policy(policy: Policy) -> None:
     Raises:
         ValueError: If any policy value is invalid
     """
-    if policy.max_interpretations < 1:
-        raise ValueError(f"max_interpretations must be >= 1, got {policy.max_interpretations}")
-    
-    if policy.max_nodes < 1:
-        raise ValueError(f"max_nodes must be >= 1, got {policy.max_nodes}")
-    
-    if policy.max_depth < 1:
-        raise ValueError(f"max_depth must be >= 1, got {policy.max_depth}")
-    
-    if policy.contradiction_budget < 0:
-        raise ValueError(f"contradiction_budget must be >= 0, got {policy.contradiction_budget}")
-    
-    if policy.max_steps < 1:
-        raise ValueError(f"max_steps must be >= 1, got {policy.max_steps}")
+    for name, minimum in _POLICY_MINIMUMS:
+        value = getattr(policy, name)
+        if value < minimum:
+            raise ValueError(f"{name} must be >= {minimum}, got {value}")
     
-    if policy.deterministic_tiebreak != 'lexicographic':
+    if policy.deterministic_tiebreak not in _TIEBREAK_METHODS:
         raise ValueError(
             f"deterministic_tiebreak must be 'lexicographic', got {policy.deterministic_tiebreak}"
         )
@@ -66,7 +68,7 @@ def tie_break(strings: List[str], method: str = 'lexicographic') -> str:
     if not strings:
         raise ValueError("Cannot tie-break empty list")
     
-    if method != 'lexicographic':
+    if method not in _TIEBREAK_METHODS:
         raise ValueError(f"Unknown tie-break method: {method}")
     
     # Lexicographic: return the smallest string (deterministic)
@@ -3,9 +3,19 @@ Type definitions for Proposal (probabilistic, non-authoritative).
 """
 
 from dataclasses import dataclass
-from typing import Any, Generic, Literal, Optional, TypeVar
+from typing import Any, Generic, List, Literal, Optional, Tuple, TypeVar
 
-from .hash import hash_canonical
+from .canonical import canonicalize
+from .hash import sha256_hex
+from .json_kinds import (
+    KIND_FLOAT,
+    KIND_MAPPING,
+    KIND_PRIMITIVE,
+    KIND_SEQUENCE,
+    KIND_TO_JSON,
+    TO_JSON_SAFE_KINDS,
+    classify,
+)
 
 T = TypeVar('T')
 
@@ -58,17 +68,19 @@ class Proposal(Generic[T]):
         # Convert value to JSON-safe for hashing
         json_safe_value = cls._to_json_safe(value)
         
-        # Build dict matching .to_json() structure (excluding proposal_hash)
-        # This ensures hash is computed from exact same dict that .to_json() returns
-        hashable_dict = {
-            "source": source,
-            "confidence": confidence,  # Include None if None (matches pydantic)
-            "value": json_safe_value
-            # Note: proposal_hash is excluded from hash (it's the result)
-        }
-        
-        # Compute hash from this dict (exact same structure as .to_json() minus proposal_hash)
-        proposal_hash = hash_canonical(hashable_dict)
+        # Hash the canonical form of the dict matching .to_json() structure
+        # (excluding proposal_hash, which is the result):
+        # {"source": source, "confidence": confidence, "value": json_safe_value},
+        # with confidence included even when None (matches pydantic).
+        # The dict has a fixed schema, so its canonical bytes are assembled
+        # around the encoded fields (keys already in sorted order) instead of
+        # building and canonicalizing the wrapper; the bytes are identical.
+        proposal_hash = sha256_hex(b''.join((
+            b'{"confidence":', canonicalize(confidence),
+            b',"source":', canonicalize(source),
+            b',"value":', canonicalize(json_safe_value),
+            b'}',
+        )))
         
         return cls(
             source=source,
@@ -85,51 +97,76 @@ class Proposal(Generic[T]):
         Recursively converts objects with .to_json() method to dicts,
         and converts lists/tuples containing such objects.
         
+        Walks the value iteratively with an explicit stack (no Python
+        recursion, so nesting depth is bounded only by memory). Items are
+        visited in the same depth-first, left-to-right order as a recursive
+        walk, so the first offending element raises the same error.
+        
         Rejects sets and unknown containers to ensure strict JSON-safety.
         
         Raises:
             TypeError: If value contains unsupported types (sets, unknown containers)
         """
-        # If it has a .to_json() method, use it
-        if hasattr(value, 'to_json') and callable(getattr(value, 'to_json', None)):
-            return value.to_json()
-        
-        # Handle lists and tuples (preserve order)
-        if isinstance(value, (list, tuple)):
-            return [Proposal._to_json_safe(item) for item in value]
-        
-        # Handle dicts (JSON-safe only: str keys)
-        if isinstance(value, dict):
-            for key in value.keys():
-                if not isinstance(key, str):
-                    raise TypeError(f"Dict keys must be strings, got {type(key).__name__}")
-            return {k: Proposal._to_json_safe(v) for k, v in value.items()}
-        
-        # Reject sets explicitly (not JSON-safe, no order)
-        if isinstance(value, (set, frozenset)):
-            raise TypeError(f"Sets are not JSON-safe: {type(value).__name__}")
-        
-        # Reject other containers (bytes, bytearray, etc.)
-        if isinstance(value, (bytes, bytearray)):
-            raise TypeError(f"Bytes are not JSON-safe: {type(value).__name__}")
-        
-        # JSON-safe primitives: None, bool, int, float, str
-        if value is None or isinstance(value, (bool, int, str)):
-            return value
-        
-        if isinstance(value, float):
-            # Reject NaN/Inf
-            if value != value:  # NaN check
-                raise ValueError("NaN is not allowed in canonical JSON")
-            if value == float('inf') or value == float('-inf'):
-                raise ValueError("Inf is not allowed in canonical JSON")
-            return value
-        
-        # Reject all other types
-        raise TypeError(
-            f"Type {type(value).__name__} is not JSON-safe. "
-            "Allowed types: None, bool, int, float, str, list, tuple, dict(str->value), or objects with .to_json()"
-        )
+        root: List[Any] = [None]
+        # (item, container to fill, slot in that container)
+        stack: List[Tuple[Any, Any, Any]] = [(value, root, 0)]
+        while stack:
+            item, parent, slot = stack.pop()
+            
+            # Dispatch on type(item): one dict lookup instead of hasattr/isinstance probes
+            kind = TO_JSON_SAFE_KINDS.get(type(item))
+            if kind is None:
+                kind = classify(type(item))
+            
+            # JSON-safe primitives: None, bool, int, str
+            if kind == KIND_PRIMITIVE:
+                parent[slot] = item
+            
+            # If it has a .to_json() method, use it
+            elif kind == KIND_TO_JSON:
+                parent[slot] = item.to_json()
+            
+            # Handle lists and tuples (preserve order)
+            elif kind == KIND_SEQUENCE:
+                result = [None] * len(item)
+                parent[slot] = result
+                for index in range(len(item) - 1, -1, -1):
+                    stack.append((item[index], result, index))
+            
+            # Handle dicts (JSON-safe only: str keys)
+            elif kind == KIND_MAPPING:
+                for key in item.keys():
+                    if not isinstance(key, str):
+                        raise TypeError(f"Dict keys must be strings, got {type(key).__name__}")
+                # Pre-seed keys so the result keeps the input's key order
+                result = dict.fromkeys(item)
+                parent[slot] = result
+                for key in reversed(result):
+                    stack.append((item[key], result, key))
+            
+            elif kind == KIND_FLOAT:
+                # Reject NaN/Inf
+                if item != item:  # NaN check
+                    raise ValueError("NaN is not allowed in canonical JSON")
+                if item == float('inf') or item == float('-inf'):
+                    raise ValueError("Inf is not allowed in canonical JSON")
+                parent[slot] = item
+            
+            # Reject sets explicitly (not JSON-safe, no order)
+            elif isinstance(item, (set, frozenset)):
+                raise TypeError(f"Sets are not JSON-safe: {type(item).__name__}")
+            
+            # Reject other containers (bytes, bytearray, etc.)
+            elif isinstance(item, (bytes, bytearray)):
+                raise TypeError(f"Bytes are not JSON-safe: {type(item).__name__}")
+            
+            # Reject all other types
+            else:
+                raise TypeError(
+                    f"Type {type(item).__name__} is not JSON-safe. "
+                    "Allowed types: None, bool, int, float, str, list, tuple, dict(str->value), or objects with .to_json()"
+                )
+        return root[0]
     
     def to_json(self) -> dict:
         """Convert to JSON-safe dict."""
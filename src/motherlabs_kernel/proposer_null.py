@@ -15,6 +15,8 @@ class NullProposer:
     Used for testing refusal behavior when proposer returns no interpretations.
     """
     
+    __slots__ = ()
+    
     def propose_interpretations(self, seed_hash: str, n: int) -> Proposal[list[Interpretation]]:
         """
         Return empty proposal.
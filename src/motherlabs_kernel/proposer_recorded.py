@@ -5,7 +5,7 @@ This proposer uses pre-recorded proposals stored in a dictionary, enabling
 deterministic testing without external dependencies.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from .ambiguity_types import Interpretation
 from .proposal_types import Proposal
@@ -20,8 +20,17 @@ class RecordedProposer:
     
     The stored values must be JSON-safe lists of interpretation data that can
     be converted to Interpretation objects.
+    
+    recordings are treated as immutable once injected: the interpretations
+    and proposal hash built for a key are cached, and each request returns
+    a new Proposal (with its own value list) around them. The cache is
+    keyed by the (seed_hash, n) tuple, so a cache hit skips formatting the
+    string key; recordings keep string keys because they are loaded from
+    JSON fixtures.
     """
     
+    __slots__ = ('recordings', '_proposal_cache')
+    
     def __init__(self, recordings: Dict[str, Any]):
         """
         Initialize with pre-recorded proposals.
@@ -32,6 +41,9 @@ class RecordedProposer:
                        Values should be JSON-safe lists of interpretation data
         """
         self.recordings = recordings
+        # (seed_hash, n) -> (interpretations, proposal_hash) for that key;
+        # Interpretation is frozen, so only the list needs to be per call
+        self._proposal_cache: Dict[Tuple[str, int], Tuple[Tuple[Interpretation, ...], str]] = {}
     
     def propose_interpretations(self, seed_hash: str, n: int) -> Proposal[list[Interpretation]]:
         """
@@ -47,19 +59,30 @@ class RecordedProposer:
         Raises:
             KeyError: If the key is not found in recordings
         """
-        key = f'interpretations:{seed_hash}:{n}'
+        cache_key = (seed_hash, n)
+        cached = self._proposal_cache.get(cache_key)
+        if cached is not None:
+            interpretations, proposal_hash = cached
+            return Proposal(
+                source="heuristic",
+                value=list(interpretations),
+                proposal_hash=proposal_hash
+            )
         
+        key = f'interpretations:{seed_hash}:{n}'
         if key not in self.recordings:
             raise KeyError(f"No recording found for key: {key}")
         
         # Get the recorded data
         recorded_data = self.recordings[key]
         
-        # Convert to Interpretation objects
+        # Convert to Interpretation objects (validated; runs once per cached key)
         interpretations = [
             Interpretation(**item) if isinstance(item, dict) else item
             for item in recorded_data
         ]
         
         # Create proposal deterministically
-        return Proposal.create("heuristic", interpretations)
+        proposal = Proposal.create("heuristic", interpretations)
+        self._proposal_cache[cache_key] = (tuple(interpretations), proposal.proposal_hash)
+        return proposal
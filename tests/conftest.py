@@ -0,0 +1,98 @@
+"""Shared pytest fixtures."""
+
+import copy
+import functools
+import json
+import os
+
+import pytest
+
+from motherlabs_kernel.engine_types import RunResult
+from motherlabs_kernel.policy_types import Policy
+from motherlabs_kernel.proposer_recorded import RecordedProposer
+from motherlabs_kernel.run_engine import run_engine
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@functools.lru_cache(maxsize=None)
+def _read_fixture(filename: str) -> str:
+    """Read a fixture file once per process."""
+    with open(os.path.join(_FIXTURES_DIR, filename), "r") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_fixture_cached(filename: str) -> dict:
+    """Parse a JSON fixture once per process (shared; never hand out)."""
+    return json.loads(_read_fixture(filename))
+
+
+def load_fixture(filename: str) -> dict:
+    """Load JSON fixture file (a fresh copy, so tests may mutate it)."""
+    return copy.deepcopy(_load_fixture_cached(filename))
+
+
+def load_text_fixture(filename: str) -> str:
+    """Load text fixture file."""
+    return _read_fixture(filename).strip()
+
+
+@pytest.fixture(scope="module")
+def default_policy() -> Policy:
+    """Policy used by most ambiguity tests (Policy is frozen, so sharing is safe)."""
+    return Policy(
+        max_interpretations=3,
+        max_nodes=100,
+        max_depth=10,
+        contradiction_budget=5,
+        max_steps=50
+    )
+
+
+@pytest.fixture(scope="module")
+def golden_seed() -> str:
+    """Golden seed text."""
+    return load_text_fixture("golden_seed.txt")
+
+
+@pytest.fixture(scope="module")
+def golden_pin() -> dict:
+    """Golden pin."""
+    return load_fixture("golden_pin.json")
+
+
+@pytest.fixture(scope="module")
+def golden_policy() -> Policy:
+    """Golden policy."""
+    return Policy(**load_fixture("golden_policy.json"))
+
+
+@pytest.fixture(scope="module")
+def golden_recordings() -> dict:
+    """Golden recordings (read-only; RecordedProposer does not mutate them)."""
+    return load_fixture("golden_proposals.json")
+
+
+@pytest.fixture(scope="module")
+def golden_proposer(golden_recordings) -> RecordedProposer:
+    """RecordedProposer over the golden recordings (caches its Proposals)."""
+    return RecordedProposer(golden_recordings)
+
+
+@pytest.fixture(scope="module")
+def golden_expected() -> dict:
+    """Expected golden-run hashes and structure snapshot (node_kinds sorted)."""
+    expected = load_fixture("golden_expected.json")
+    structure = expected["expected_structure"]
+    structure["node_kinds"] = sorted(structure["node_kinds"])
+    return expected
+
+
+@pytest.fixture(scope="module")
+def golden_result(golden_seed, golden_pin, golden_policy, golden_proposer) -> RunResult:
+    """One golden engine run, shared by the golden-run tests."""
+    return run_engine(
+        "golden_run_001", golden_seed, golden_pin, golden_policy, golden_proposer,
+        "T000000", step_ms=1
+    )
@@ -1,5 +1,7 @@
 """Tests for autonomous ambiguity resolution."""
 
+import dataclasses
+
 import pytest
 
 from motherlabs_kernel.ambiguity import Proposer, resolve_ambiguity
@@ -20,7 +22,7 @@ class FixedProposer:
         return Proposal.create("heuristic", self.interpretations[:n])
 
 
-def test_resolve_ambiguity_deterministic_winner():
+def test_resolve_ambiguity_deterministic_winner(default_policy):
     """Fixed proposer output produces deterministic winner."""
     interpretations = [
         Interpretation(name="A", assumptions=["assume1"], intent_summary="short"),
@@ -29,13 +31,7 @@ def test_resolve_ambiguity_deterministic_winner():
     ]
     
     proposer = FixedProposer(interpretations)
-    policy = Policy(
-        max_interpretations=3,
-        max_nodes=100,
-        max_depth=10,
-        contradiction_budget=5,
-        max_steps=50
-    )
+    policy = default_policy
     
     commit1 = resolve_ambiguity("run1", "seed_hash_123", policy, proposer)
     commit2 = resolve_ambiguity("run1", "seed_hash_123", policy, proposer)
@@ -45,7 +41,32 @@ def test_resolve_ambiguity_deterministic_winner():
     assert commit1.commit_hash == commit2.commit_hash
 
 
-def test_resolve_ambiguity_tie_breaking_deterministic():
+def test_resolve_ambiguity_reuses_given_proposal(default_policy):
+    """A proposal passed in is collapsed without querying the proposer."""
+    interpretations = [
+        Interpretation(name="A", assumptions=["assume1"], intent_summary="short"),
+        Interpretation(name="B", assumptions=["assume2"], intent_summary="longer summary"),
+    ]
+    
+    class CountingProposer(FixedProposer):
+        calls = 0
+        
+        def propose_interpretations(self, seed_hash, n):
+            CountingProposer.calls += 1
+            return super().propose_interpretations(seed_hash, n)
+    
+    proposer = CountingProposer(interpretations)
+    policy = default_policy
+    
+    proposal = proposer.propose_interpretations("seed_hash_123", policy.max_interpretations)
+    commit = resolve_ambiguity("run1", "seed_hash_123", policy, proposer, proposal)
+    assert CountingProposer.calls == 1
+    assert commit.accepted_from == proposal.proposal_hash
+    assert commit == resolve_ambiguity("run1", "seed_hash_123", policy, proposer)
+    assert CountingProposer.calls == 2
+
+
+def test_resolve_ambiguity_tie_breaking_deterministic(default_policy):
     """Tie-breaking is deterministic (lexicographic by name)."""
     # Create interpretations with same cost potential (will have same cost)
     interpretations = [
@@ -55,13 +76,7 @@ def test_resolve_ambiguity_tie_breaking_deterministic():
     ]
     
     proposer = FixedProposer(interpretations)
-    policy = Policy(
-        max_interpretations=3,
-        max_nodes=100,
-        max_depth=10,
-        contradiction_budget=5,
-        max_steps=50
-    )
+    policy = default_policy
     
     commit = resolve_ambiguity("run1", "seed_hash_123", policy, proposer)
     
@@ -91,21 +106,43 @@ def test_resolve_ambiguity_respects_max_interpretations():
     assert commit.value.name in ["Interp0", "Interp1", "Interp2", "Interp3", "Interp4", "Interp5", "Interp6", "Interp7", "Interp8", "Interp9"]
 
 
-def test_resolve_ambiguity_empty_proposal():
+def test_resolve_ambiguity_empty_proposal(default_policy):
     """Empty proposal raises ValueError."""
     proposer = FixedProposer([])
-    policy = Policy(
-        max_interpretations=3,
-        max_nodes=100,
-        max_depth=10,
-        contradiction_budget=5,
-        max_steps=50
-    )
+    policy = default_policy
     
     with pytest.raises(ValueError, match="empty"):
         resolve_ambiguity("run1", "seed_hash_123", policy, proposer)
 
 
+def test_resolve_ambiguity_nonpositive_max_interpretations():
+    """Limits below 1 act like the pruning slice: 0 refuses, negatives drop from the end."""
+    interpretations = [
+        Interpretation(name="A", assumptions=[], intent_summary="s"),
+        Interpretation(name="B", assumptions=["x"], intent_summary="s"),
+    ]
+    proposer = FixedProposer(interpretations)
+    proposal = Proposal.create("heuristic", interpretations)
+    
+    def policy(limit):
+        return Policy(
+            max_interpretations=limit, max_nodes=100, max_depth=10,
+            contradiction_budget=5, max_steps=50
+        )
+    
+    # -1 drops only the last-ranked interpretation, so the winner is committed
+    commit = resolve_ambiguity("run1", "seed_hash_123", policy(-1), proposer, proposal)
+    assert commit.value.name == "A"
+    for limit in (0, -2, -5):
+        with pytest.raises(ValueError, match="No interpretations after pruning"):
+            resolve_ambiguity("run1", "seed_hash_123", policy(limit), proposer, proposal)
+    
+    # prune_interpretations slices the same way
+    from motherlabs_kernel.prune import prune_interpretations
+    for limit in (0, -1, -2):
+        assert prune_interpretations(interpretations, policy(limit)) == interpretations[:limit]
+
+
 def test_scoring_duplicate_assumptions_penalty():
     """Scoring penalizes duplicate assumptions across interpretations (cost: lower is better)."""
     from motherlabs_kernel.scoring import score_interpretation
@@ -126,11 +163,107 @@ def test_scoring_duplicate_assumptions_penalty():
     assert cost3 < cost2
 
 
-def test_prune_sorts_by_cost_ascending_then_name():
+def test_scoring_precomputed_assumption_counts():
+    """Precomputed assumption counts give the same scores as per-call counting."""
+    from motherlabs_kernel.scoring import build_assumption_counts, score_interpretation
+    
+    interp1 = Interpretation(name="A", assumptions=["shared", "x"], intent_summary="s1")
+    interp2 = Interpretation(name="B", assumptions=["shared", "x"], intent_summary="s2")
+    interp3 = Interpretation(name="C", assumptions=["shared"], intent_summary="s3")
+    all_interps = [interp1, interp2, interp3]
+    
+    counts = build_assumption_counts(all_interps)
+    assert counts == {"shared": 3, "x": 2}
+    for interp in all_interps:
+        assert score_interpretation(interp, all_interps, counts) == score_interpretation(
+            interp, all_interps
+        )
+    # shared appears 3 times (+10), x twice (+5): base 2 + 20, penalty 15
+    assert score_interpretation(interp1, all_interps, counts) == 2 + 20 + 15
+
+
+def test_score_all_matches_score_interpretation():
+    """score_all agrees with score_interpretation, with or without shared assumptions."""
+    from motherlabs_kernel.scoring import (
+        count_duplicate_assumptions,
+        score_all,
+        score_interpretation,
+    )
+    
+    a = Interpretation(name="A", assumptions=["x", "y"], intent_summary="s1")
+    b = Interpretation(name="B", assumptions=["y"], intent_summary="summary2")
+    c = Interpretation(name="C", assumptions=["z"], intent_summary="s3")
+    for interps, duplicates in (([a, c], 0), ([a, b, c], 1), ([a, b, a], 3)):
+        assert count_duplicate_assumptions(interps) == duplicates
+        assert score_all(interps) == [score_interpretation(i, interps) for i in interps]
+    assert score_all([]) == []
+
+
+def test_prune_repeated_interpretation_objects(default_policy):
+    """Repeated interpretation objects are scored once but kept per occurrence."""
+    from motherlabs_kernel.prune import prune_interpretations
+    from motherlabs_kernel.scoring import score_interpretation
+    
+    a = Interpretation(name="A", assumptions=["x"], intent_summary="s")
+    b = Interpretation(name="B", assumptions=["y"], intent_summary="s")
+    interpretations = [a, b, a]
+    policy = default_policy
+    
+    # a's assumption appears twice, so a carries the duplicate penalty
+    assert score_interpretation(a, interpretations) == score_interpretation(b, interpretations) + 5
+    pruned = prune_interpretations(interpretations, policy)
+    assert pruned == [b, a, a]
+    assert pruned[1] is a and pruned[2] is a
+
+
+def test_prune_large_set_matches_full_sort(default_policy):
+    """Top-K selection on a large set matches a full (score, name) sort."""
+    from motherlabs_kernel.prune import prune_interpretations
+    from motherlabs_kernel.scoring import score_all
+    
+    # Tied scores and tied names, so order falls back to (name, position)
+    interpretations = [
+        Interpretation(
+            name=f"I{i % 7}",
+            assumptions=[f"a{i % 5}", f"b{i % 3}"][: 1 + i % 2],
+            intent_summary="s" * (i % 4)
+        )
+        for i in range(120)
+    ]
+    policy = default_policy
+    
+    scores = score_all(interpretations)
+    expected = sorted(range(120), key=lambda i: (scores[i], interpretations[i].name, i))[:3]
+    pruned = prune_interpretations(interpretations, policy)
+    assert [id(i) for i in pruned] == [id(interpretations[i]) for i in expected]
+
+
+def test_select_winner_matches_prune_first(default_policy):
+    """select_winner picks the interpretation pruning ranks first."""
+    from motherlabs_kernel.prune import prune_interpretations, select_winner
+    
+    policy = default_policy
+    tied_a = Interpretation(name="A", assumptions=["x"], intent_summary="s")
+    tied_b = Interpretation(name="A", assumptions=["y"], intent_summary="s")
+    for interpretations in (
+        [
+            Interpretation(name="Z", assumptions=["a", "b"], intent_summary="long"),
+            Interpretation(name="M", assumptions=["a"], intent_summary="s"),
+            Interpretation(name="B", assumptions=["c"], intent_summary="s"),
+        ],
+        # Equal cost and name: the earlier one wins
+        [tied_b, tied_a],
+    ):
+        assert select_winner(interpretations) is prune_interpretations(interpretations, policy)[0]
+    
+    with pytest.raises(ValueError):
+        select_winner([])
+
+
+def test_prune_sorts_by_cost_ascending_then_name(default_policy):
     """Pruning sorts by cost (ascending: lower is better) then name (lexicographic)."""
     from motherlabs_kernel.prune import prune_interpretations
     from motherlabs_kernel.scoring import score_interpretation
-    from motherlabs_kernel.policy_types import Policy
     
     # Create interpretations with different costs
     # interp2/interp3 have fewer assumptions -> lower cost -> should win
@@ -139,13 +272,7 @@ def test_prune_sorts_by_cost_ascending_then_name():
     interp3 = Interpretation(name="B", assumptions=["a"], intent_summary="short")
     
     interpretations = [interp1, interp2, interp3]
-    policy = Policy(
-        max_interpretations=3,
-        max_nodes=100,
-        max_depth=10,
-        contradiction_budget=5,
-        max_steps=50
-    )
+    policy = default_policy
     
     pruned = prune_interpretations(interpretations, policy)
     
@@ -218,7 +345,7 @@ def test_interpretation_rejects_duplicate_assumptions():
         assumptions=["assumption1", "assumption2"],
         intent_summary="Valid interpretation"
     )
-    assert valid.assumptions == ["assumption1", "assumption2"]
+    assert valid.assumptions == ("assumption1", "assumption2")
     
     # Invalid: duplicate assumptions
     with pytest.raises(ValueError, match="duplicate assumptions"):
@@ -236,13 +363,44 @@ def test_interpretation_rejects_duplicate_assumptions():
             intent_summary="Invalid interpretation"
         )
     
+    # Each repeated string is reported once
+    with pytest.raises(ValueError, match=r"\['x'\]\. "):
+        Interpretation(
+            name="Invalid",
+            assumptions=["x", "x", "x"],
+            intent_summary="Invalid interpretation"
+        )
+    
     # Edge case: empty assumptions (valid)
     empty = Interpretation(
         name="Empty",
         assumptions=[],
         intent_summary="No assumptions"
     )
-    assert empty.assumptions == []
+    assert empty.assumptions == ()
+
+
+def test_interpretation_to_json_fresh_dict():
+    """to_json returns a new list-valued dict each call; mutating it leaves hashes alone."""
+    a = Interpretation(name="A", assumptions=["x"], intent_summary="sum")
+    
+    assert a.to_json() is not a.to_json()
+    assert a.to_json() == {"name": "A", "assumptions": ["x"], "intent_summary": "sum"}
+    assert [f.name for f in dataclasses.fields(a)] == ["name", "assumptions", "intent_summary"]
+    
+    before = Proposal.create("heuristic", [a]).proposal_hash
+    a.to_json()["name"] = "B"
+    assert Proposal.create("heuristic", [a]).proposal_hash == before
+
+
+def test_interpretation_assumptions_frozen_to_tuple():
+    """List assumptions are stored as a tuple, so instances are hashable."""
+    a = Interpretation(name="A", assumptions=["x", "y"], intent_summary="sum")
+    b = Interpretation(name="A", assumptions=("x", "y"), intent_summary="sum")
+    
+    assert a.assumptions == ("x", "y")
+    assert a == b
+    assert hash(a) == hash(b)
 
 
 def test_proposer_recorded_validates_duplicate_assumptions():
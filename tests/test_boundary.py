@@ -1,8 +1,16 @@
 """Tests for Proposal vs Commit boundary."""
 
+import dataclasses
+
+import pytest
+
 from motherlabs_kernel.commit_types import Commit
+from motherlabs_kernel.hash import hash_canonical
 from motherlabs_kernel.proposal_types import Proposal
 
+_PROPOSAL_FIELDS = {f.name for f in dataclasses.fields(Proposal)}
+_COMMIT_FIELDS = {f.name for f in dataclasses.fields(Commit)}
+
 
 def test_proposal_deterministic_hash():
     """Proposal hashing is deterministic."""
@@ -49,15 +57,11 @@ def test_proposal_commit_cannot_be_confused():
     proposal = Proposal.create("llm", {"data": "value"})
     commit = Commit.create({"data": "value"})
     
-    # Different fields
-    assert hasattr(proposal, "source")
-    assert hasattr(proposal, "proposal_hash")
-    assert not hasattr(proposal, "commit_hash")
-    
-    assert hasattr(commit, "commit_hash")
-    assert hasattr(commit, "accepted_from")
-    assert not hasattr(commit, "source")
-    assert not hasattr(commit, "proposal_hash")
+    # Different fields: exact field sets (slotted dataclasses, so no stray
+    # instance attributes can appear)
+    assert _PROPOSAL_FIELDS == {"source", "confidence", "value", "proposal_hash"}
+    assert _COMMIT_FIELDS == {"value", "accepted_from", "commit_hash"}
+    assert not hasattr(proposal, "__dict__") and not hasattr(commit, "__dict__")
     
     # Different hash values (even with same value)
     assert proposal.proposal_hash != commit.commit_hash
@@ -108,3 +112,75 @@ def test_proposal_equivalent_values_hash_identically():
     
     # Should hash identically due to canonicalization
     assert proposal1.proposal_hash == proposal2.proposal_hash
+
+
+@pytest.mark.parametrize("create", [
+    lambda value: Proposal.create("llm", value),
+    Commit.create,
+], ids=["proposal", "commit"])
+def test_json_safe_dispatch(create):
+    """.to_json() objects are converted and non-JSON-safe types rejected via type dispatch."""
+    from motherlabs_kernel.ambiguity_types import Interpretation
+    
+    interp = Interpretation(name="A", assumptions=["a"], intent_summary="sum")
+    created = create([interp, (1, 2.5, None, True)])
+    assert created.to_json()["value"] == [interp.to_json(), [1, 2.5, None, True]]
+    
+    with pytest.raises(TypeError, match="Sets"):
+        create({"data": {1, 2}})
+    with pytest.raises(TypeError, match="Bytes"):
+        create([b"raw"])
+    with pytest.raises(ValueError, match="NaN"):
+        create([float("nan")])
+    with pytest.raises(ValueError, match="Inf"):
+        create([float("inf")])
+
+
+def test_commit_to_json_fresh_value():
+    """to_json() converts the current value on each call, into a new dict."""
+    commit = Commit.create({"items": [1, 2]}, accepted_from="abc")
+    assert commit.to_json()["value"] is not commit.to_json()["value"]
+    commit.to_json()["value"]["items"].append(3)
+    assert commit.to_json()["value"] == {"items": [1, 2]}
+    assert [f.name for f in dataclasses.fields(commit)] == ["value", "accepted_from", "commit_hash"]
+    
+    # Directly constructed commits convert the same way and compare equal
+    direct = Commit(value={"items": [1, 2]}, accepted_from="abc", commit_hash=commit.commit_hash)
+    assert direct.to_json() == commit.to_json()
+    assert direct == commit
+
+
+def test_proposal_json_safe_deep_nesting():
+    """Proposal._to_json_safe walks nesting deeper than the recursion limit."""
+    import sys
+    
+    depth = sys.getrecursionlimit() + 100
+    value = "leaf"
+    for _ in range(depth):
+        value = [{"k": value}]
+    
+    converted = Proposal._to_json_safe(value)
+    for _ in range(depth):
+        converted = converted[0]["k"]
+    assert converted == "leaf"
+
+
+def test_hashes_match_canonical_envelope_dicts():
+    """proposal_hash/commit_hash equal hash_canonical of the to_json() dict minus the hash."""
+    for source, confidence, value in (
+        ("llm", None, {"data": "value"}),
+        ("retrieval", 0.25, ["é", 1, None]),
+        ("heuristic", 1.0, "plain"),
+    ):
+        proposal = Proposal.create(source, value, confidence=confidence)
+        assert proposal.proposal_hash == hash_canonical(
+            {"source": source, "confidence": confidence, "value": value}
+        )
+        for accepted_from in (None, proposal.proposal_hash):
+            commit = Commit.create(value, accepted_from=accepted_from)
+            assert commit.commit_hash == hash_canonical(
+                {"value": value, "accepted_from": accepted_from}
+            )
+    
+    with pytest.raises(ValueError):
+        Proposal.create("llm", {"data": "value"}, confidence=float("nan"))
@@ -144,3 +144,39 @@ def test_hash_canonical_key_order_invariant():
     hash2 = hash_canonical(dict2)
     
     assert hash1 == hash2
+
+
+def test_equal_but_distinct_values_not_conflated():
+    """Values that compare equal in Python but serialize differently stay distinct."""
+    assert canonicalize(1) == b'1'
+    assert canonicalize(True) == b'true'
+    assert canonicalize(1.0) == b'1.0'
+    assert canonicalize(0.0) == b'0.0'
+    assert canonicalize(-0.0) == b'-0.0'
+    assert canonicalize([True, 1, 1.0]) == b'[true,1,1.0]'
+    assert canonicalize({"a": 1}) == b'{"a":1}'
+    assert canonicalize([["a", 1]]) == b'[["a",1]]'
+    assert hash_canonical(1) != hash_canonical(True)
+    assert hash_canonical(1) != hash_canonical(1.0)
+
+
+def test_matches_json_dumps_reference():
+    """Hand-rolled encoder output is byte-identical to json.dumps canonical form."""
+    import json
+    value = {
+        "z": ["é", " ", "quote\"", "back\\slash", "\n\t\x00", "😀"],
+        "a": {"nested": [1.5, -0.0, 1e300, 10 ** 30, None, False]},
+        "": (),
+    }
+    expected = json.dumps(
+        value, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+    ).encode('utf-8')
+    assert canonicalize(value) == expected
+
+
+def test_top_level_scalars_match_json_dumps_reference():
+    """Top-level scalar fast paths agree with json.dumps (escapes, bool vs int)."""
+    import json
+    for value in ["", "é \"q\" \\ \n\x1f😀", 0, -7, 10 ** 30, True, False, None, 2.5]:
+        expected = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        assert canonicalize(value) == expected
@@ -3,8 +3,22 @@
 import pytest
 
 from motherlabs_kernel.dag import DAG
-from motherlabs_kernel.dag_invariants import DAGInvariantError
-from motherlabs_kernel.dag_types import Edge, Node
+from motherlabs_kernel.dag_ids import edge_id, node_id
+from motherlabs_kernel.dag_invariants import (
+    DAGInvariantError,
+    TopologicalOrder,
+    check_cycles,
+    check_duplicate_node_ids,
+)
+from motherlabs_kernel.dag_types import (
+    EDGE_TAG_CONTRADICTS,
+    EDGE_TAG_DEPENDS_ON,
+    EDGE_TAG_REFINES,
+    EDGE_TAG_UNKNOWN,
+    Edge,
+    Node,
+)
+from motherlabs_kernel.hash import hash_canonical
 
 
 def test_dag_add_node():
@@ -59,6 +73,22 @@ def test_dag_duplicate_node_id_same_content():
     assert len(dag.get_nodes()) == 1
 
 
+def test_dag_readd_returns_existing_objects():
+    """Re-adding the same node or edge content returns the stored object."""
+    dag = DAG(run_id="test_run")
+    node1 = dag.add_node("seed", {"data": "value"})
+    node2 = dag.add_node("claim", {"data": "value"})
+    edge = dag.add_edge("depends_on", node1.id, node2.id)
+    
+    # Equal payload built separately, and the same payload under another kind
+    assert dag.add_node("seed", {"data": "value"}) is node1
+    assert dag.add_node("claim", {"data": "value"}) is node2
+    assert dag.add_edge("depends_on", node1.id, node2.id) is edge
+    assert dag.add_edge("refines", node1.id, node2.id) is not edge
+    assert len(dag.get_nodes()) == 2
+    assert len(dag.get_edges()) == 2
+
+
 def test_dag_duplicate_node_id_different_content():
     """Duplicate node ID with different content raises error."""
     dag = DAG(run_id="test_run")
@@ -98,8 +128,28 @@ def test_dag_cycle_detection_depends_on():
     dag.add_edge("depends_on", node1.id, node2.id)
     dag.add_edge("depends_on", node2.id, node3.id)
     
-    with pytest.raises(DAGInvariantError, match="Cycle detected"):
+    with pytest.raises(DAGInvariantError, match="Cycle detected") as excinfo:
         dag.add_edge("depends_on", node3.id, node1.id)
+    # The named node lies on the cycle the rejected edge would close
+    assert f"starting from node {node3.id} " in str(excinfo.value)
+
+
+def test_topological_order_reorders_back_edges():
+    """Back-pointing edges are accepted after reordering unless they close a cycle."""
+    order = TopologicalOrder()
+    a, b, c, d = (order.add_node() for _ in range(4))
+    assert (a, b, c, d) == (0, 1, 2, 3)
+    
+    # d -> c -> b -> a all point against insertion order
+    assert order.insert_edge(d, c)
+    assert order.insert_edge(c, b)
+    assert order.insert_edge(b, a)
+    assert order.insert_edge(d, a)
+    assert not order.insert_edge(a, d)
+    assert not order.insert_edge(a, c)
+    assert not order.insert_edge(b, b)
+    # Rejected edges leave the order usable
+    assert order.insert_edge(c, a)
 
 
 def test_dag_cycle_detection_refines():
@@ -170,3 +220,124 @@ def test_dag_invariant_violations_raise():
     node1 = dag.add_node("seed", {"data": "value"})
     with pytest.raises(DAGInvariantError):
         dag.add_edge("depends_on", node1.id, "fake_id")
+
+
+def test_dag_rejected_edge_not_stored():
+    """An edge rejected by the incremental checks leaves the DAG unchanged."""
+    dag = DAG(run_id="test_run")
+    node1 = dag.add_node("seed", {"data1": "value1"})
+    node2 = dag.add_node("interpretation", {"data2": "value2"})
+    node3 = dag.add_node("assumption", {"data3": "value3"})
+    
+    dag.add_edge("depends_on", node1.id, node2.id)
+    with pytest.raises(DAGInvariantError, match="Cycle detected"):
+        dag.add_edge("refines", node2.id, node1.id)
+    assert len(dag.get_edges()) == 1
+    
+    # DAG stays usable and agrees with the full-graph check
+    dag.add_edge("depends_on", node2.id, node3.id)
+    check_cycles(dag.get_edges(), dag.get_node_ids())
+    assert len(dag.get_edges()) == 2
+
+
+def test_dag_ids_match_canonical_domain_hash():
+    """Specialized node_id/edge_id encoding equals hash_canonical of the domain dict."""
+    for run_id in ("test_run", 'quo"te\\slash', "caf\u00e9 \u2603", "ctrl\n\x01"):
+        assert node_id(run_id, "seed", "ab" * 32) == hash_canonical(
+            {"t": "node", "run_id": run_id, "kind": "seed", "payload_hash": "ab" * 32}
+        )
+        assert edge_id(run_id, "refines", "from\t", "to") == hash_canonical(
+            {"t": "edge", "run_id": run_id, "kind": "refines", "from": "from\t", "to": "to"}
+        )
+
+
+def test_dag_getters_return_snapshots():
+    """Getters reuse one immutable snapshot until the DAG changes."""
+    dag = DAG(run_id="test_run")
+    seed = dag.add_node("seed", {"seed": "data"})
+    
+    nodes = dag.get_nodes()
+    assert dag.get_nodes() is nodes
+    assert dag.get_node_ids() is dag.get_node_ids()
+    
+    interp = dag.add_node("interpretation", {"interp": "data"})
+    assert nodes == (seed,)
+    assert dag.get_nodes() == (seed, interp)
+    assert dag.get_node_ids() == {seed.id, interp.id}
+    
+    dag.add_edge("refines", seed.id, interp.id)
+    assert [e.from_id for e in dag.get_edges()] == [seed.id]
+
+
+def test_check_cycles_deep_chain_no_recursion_limit():
+    """check_cycles handles chains deeper than the recursion limit."""
+    import sys
+    
+    depth = sys.getrecursionlimit() + 100
+    ids = [f"n{i}" for i in range(depth)]
+    edges = [
+        Edge(id=f"e{i}", kind="depends_on", from_id=ids[i], to_id=ids[i + 1])
+        for i in range(depth - 1)
+    ]
+    check_cycles(edges, set(ids))
+    
+    closing = Edge(id="back", kind="refines", from_id=ids[-1], to_id=ids[0])
+    with pytest.raises(DAGInvariantError, match="Cycle detected"):
+        check_cycles(edges + [closing], set(ids))
+
+
+def test_check_duplicate_node_ids():
+    """Repeated node IDs are allowed only with identical kind and payload_hash."""
+    node = Node(id="n1", kind="seed", payload={"a": 1}, payload_hash="h1")
+    same = Node(id="n1", kind="seed", payload={"a": 1}, payload_hash="h1")
+    check_duplicate_node_ids([node, same])
+    
+    different = Node(id="n1", kind="claim", payload={"a": 1}, payload_hash="h1")
+    with pytest.raises(DAGInvariantError, match="existing=seed/h1, new=claim/h1"):
+        check_duplicate_node_ids([node, different])
+
+
+def test_edge_kind_tag():
+    """Edge.kind_tag is derived from kind and stays out of equality/JSON."""
+    tags = {
+        "depends_on": EDGE_TAG_DEPENDS_ON,
+        "refines": EDGE_TAG_REFINES,
+        "contradicts": EDGE_TAG_CONTRADICTS,
+        "other": EDGE_TAG_UNKNOWN,
+    }
+    for kind, tag in tags.items():
+        edge = Edge(id="e", kind=kind, from_id="a", to_id="b")  # type: ignore
+        assert edge.kind_tag == tag
+        assert "kind_tag" not in edge.to_json()
+    
+    assert Edge(id="e", kind="refines", from_id="a", to_id="b") == Edge(
+        id="e", kind="refines", from_id="a", to_id="b"
+    )
+
+
+def test_dag_sorted_ids_track_inserts():
+    """sorted_node_ids/sorted_edge_ids stay sorted as the DAG grows."""
+    dag = DAG(run_id="test_run")
+    first = dag.add_node("seed", {"n": 0})
+    assert dag.sorted_node_ids() == (first.id,)
+    assert dag.sorted_edge_ids() == ()
+    
+    for i in range(1, 20):
+        node = dag.add_node("claim", {"n": i})
+        dag.add_edge("depends_on", first.id, node.id)
+        assert dag.sorted_node_ids() == tuple(sorted(dag.get_node_ids()))
+    dag.add_node("seed", {"n": 0})  # duplicate insert adds nothing
+    assert dag.sorted_node_ids() == tuple(sorted(n.id for n in dag.get_nodes()))
+    assert dag.sorted_edge_ids() == tuple(sorted(e.id for e in dag.get_edges()))
+
+
+def test_dag_commit_payload():
+    """commit_payload lists node and edge IDs/kinds in insertion order."""
+    dag = DAG(run_id="test_run")
+    seed = dag.add_node("seed", {"n": 0})
+    claim = dag.add_node("claim", {"n": 1})
+    edge = dag.add_edge("refines", seed.id, claim.id)
+    assert dag.commit_payload() == {
+        "nodes": [{"id": seed.id, "kind": "seed"}, {"id": claim.id, "kind": "claim"}],
+        "edges": [{"id": edge.id, "kind": "refines", "from": seed.id, "to": claim.id}],
+    }
@@ -1,69 +1,22 @@
 """Golden run test that locks determinism permanently."""
 
-import json
-import os
+import pytest
 
 from motherlabs_kernel.hash import hash_canonical
-from motherlabs_kernel.policy_types import Policy
+from motherlabs_kernel.ledger_validate import validate_chain
 from motherlabs_kernel.proposer_recorded import RecordedProposer
 from motherlabs_kernel.replay import replay_from_ledger
 from motherlabs_kernel.run_engine import run_engine
 
 
-def load_fixture(filename: str) -> dict:
-    """Load JSON fixture file."""
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", filename)
-    with open(fixture_path, "r") as f:
-        return json.load(f)
-
-
-def load_text_fixture(filename: str) -> str:
-    """Load text fixture file."""
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", filename)
-    with open(fixture_path, "r") as f:
-        return f.read().strip()
-
-
-def test_golden_run():
-    """
-    Golden run test that locks determinism.
-    
-    This test:
-    1. Loads fixtures (seed, pin, policy, proposals)
-    2. Builds policy + RecordedProposer
-    3. Runs engine with fixed run_id and ts_base
-    4. Asserts exact matches to expected values
-    5. Replays and asserts exact matches
-    
-    If anything changes, fix determinism; do not weaken assertions.
-    """
-    # Load fixtures
-    seed_text = load_text_fixture("golden_seed.txt")
-    pin = load_fixture("golden_pin.json")
-    policy_data = load_fixture("golden_policy.json")
-    proposals_data = load_fixture("golden_proposals.json")
-    expected = load_fixture("golden_expected.json")
-    
-    # Build policy
-    policy = Policy(**policy_data)
-    
-    # Compute seed hash (must match what's in proposals key)
-    seed_hash = hash_canonical(seed_text)
-    
-    # Build RecordedProposer
-    proposer = RecordedProposer(proposals_data)
-    
-    # Fixed run parameters
-    run_id = "golden_run_001"
-    ts_base = "T000000"
-    
-    # Run engine
-    result = run_engine(run_id, seed_text, pin, policy, proposer, ts_base, step_ms=1)
-    
-    # Extract values for comparison
+def _golden_summary(result) -> dict:
+    """Summary data (ledger last hash, DAG root hash, artifact hashes) of a run."""
+    # Ledger last hash
     ledger_last_hash = result.ledger_records[-1].record_hash if result.ledger_records else ""
     
-    # Compute DAG root hash
+    # Compute DAG root hash. This is recomputed with the same frozen
+    # definition run_engine and replay use (hash_canonical of the sorted ID
+    # lists), not a test-only digest, so it pins that definition.
     node_ids = sorted([n.id for n in result.dag_nodes])
     edge_ids = sorted([e.id for e in result.dag_edges])
     dag_root_hash = hash_canonical({"node_ids": node_ids, "edge_ids": edge_ids})
@@ -73,12 +26,32 @@ def test_golden_run():
     if "blueprint" in result.artifacts:
         artifact_hashes["blueprint"] = result.artifacts["blueprint"].compute_hash()
     
-    # Compute summary hash
-    summary_data = {
+    return {
         "ledger_last_hash": ledger_last_hash,
         "dag_root_hash": dag_root_hash,
         "artifact_hashes": artifact_hashes
     }
+
+
+def test_golden_run(golden_result, golden_expected):
+    """
+    Golden run test that locks determinism.
+    
+    This test:
+    1. Takes the shared golden run (conftest: fixtures loaded, policy +
+       RecordedProposer built, engine run with fixed run_id and ts_base)
+    2. Asserts exact matches to expected values
+    3. Validates the ledger chain (replay is test_golden_replay)
+    
+    If anything changes, fix determinism; do not weaken assertions.
+    """
+    result = golden_result
+    expected = golden_expected
+    
+    summary_data = _golden_summary(result)
+    ledger_last_hash = summary_data["ledger_last_hash"]
+    dag_root_hash = summary_data["dag_root_hash"]
+    artifact_hashes = summary_data["artifact_hashes"]
     summary_hash = hash_canonical(summary_data)
     
     # Check structure
@@ -122,40 +95,39 @@ def test_golden_run():
     assert len(result.dag_edges) == expected_structure["edge_count"], \
         f"Edge count mismatch: got {len(result.dag_edges)}, expected {expected_structure['edge_count']}"
     
-    assert node_kinds == sorted(expected_structure["node_kinds"]), \
-        f"Node kinds mismatch: got {node_kinds}, expected {sorted(expected_structure['node_kinds'])}"
+    assert node_kinds == expected_structure["node_kinds"], \
+        f"Node kinds mismatch: got {node_kinds}, expected {expected_structure['node_kinds']}"
     
-    # Replay and assert exact matches
-    replay_result = replay_from_ledger(result.ledger_records, run_id)
+    # Chain integrity only; the full replay is test_golden_replay (slow)
+    assert validate_chain(result.ledger_records) is True, "Ledger validation failed"
+
+
+@pytest.mark.slow
+def test_golden_replay(golden_result):
+    """Replay the golden ledger and assert exact matches."""
+    replay_result = replay_from_ledger(golden_result.ledger_records, "golden_run_001")
     
     assert replay_result["ledger_valid"] is True, "Replay ledger validation failed"
     
     if replay_result.get("matches_expected"):
+        summary_hash = hash_canonical(_golden_summary(golden_result))
         assert replay_result["summary_hash"] == summary_hash, \
             f"Replay summary hash mismatch: got {replay_result['summary_hash']}, expected {summary_hash}"
 
 
-def test_golden_run_deterministic():
-    """Run golden test twice to ensure determinism."""
-    # Load fixtures
-    seed_text = load_text_fixture("golden_seed.txt")
-    pin = load_fixture("golden_pin.json")
-    policy_data = load_fixture("golden_policy.json")
-    proposals_data = load_fixture("golden_proposals.json")
-    
-    policy = Policy(**policy_data)
-    seed_hash = hash_canonical(seed_text)
-    proposer = RecordedProposer(proposals_data)
-    
-    run_id = "golden_run_002"
-    ts_base = "T000000"
-    
-    # Run twice
-    result1 = run_engine(run_id, seed_text, pin, policy, proposer, ts_base, step_ms=1)
-    result2 = run_engine(run_id, seed_text, pin, policy, proposer, ts_base, step_ms=1)
-    
-    # All hashes should match
-    assert result1.ledger_records[0].record_hash == result2.ledger_records[0].record_hash
-    assert len(result1.ledger_records) == len(result2.ledger_records)
-    assert len(result1.dag_nodes) == len(result2.dag_nodes)
-    assert len(result1.dag_edges) == len(result2.dag_edges)
+def test_golden_run_deterministic(golden_seed, golden_pin, golden_policy, golden_recordings):
+    """Run the golden inputs twice, each with a fresh proposer, and check determinism."""
+    # A new RecordedProposer per run, so each run builds its own Proposals
+    result1, result2 = (
+        run_engine(
+            "golden_run_002", golden_seed, golden_pin, golden_policy,
+            RecordedProposer(golden_recordings), "T000000", step_ms=1
+        )
+        for _ in range(2)
+    )
+    
+    # All hashes should match (one list compare each; covers the lengths)
+    assert [r.record_hash for r in result1.ledger_records] == \
+        [r.record_hash for r in result2.ledger_records]
+    assert [n.id for n in result1.dag_nodes] == [n.id for n in result2.dag_nodes]
+    assert [e.id for e in result1.dag_edges] == [e.id for e in result2.dag_edges]
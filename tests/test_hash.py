@@ -1,6 +1,10 @@
 """Tests for SHA-256 hashing functions."""
 
-from motherlabs_kernel.hash import sha256_hex, hash_canonical
+import hashlib
+
+from motherlabs_kernel import hash as hash_module
+from motherlabs_kernel.canonical import canonicalize, canonicalize_into
+from motherlabs_kernel.hash import sha256_hex, hash_canonical, hash_canonical_streaming
 
 
 def test_sha256_hex_bytes():
@@ -36,6 +40,12 @@ def test_sha256_hex_deterministic():
     assert result1 == result2
 
 
+def test_sha256_backed_by_hashlib():
+    """Hashing goes through hashlib's constructor, not a pure-Python fallback."""
+    assert hash_module._sha256 is hashlib.sha256
+    assert sha256_hex(b"abc") == hashlib.sha256(b"abc").hexdigest()
+
+
 def test_hash_canonical_simple():
     """hash_canonical works with simple values."""
     result = hash_canonical("hello")
@@ -44,6 +54,17 @@ def test_hash_canonical_simple():
     assert result.islower()
 
 
+def test_hash_canonical_scalars_hash_canonical_bytes():
+    """Scalars hash their canonical JSON bytes (no type-prefixed shortcut)."""
+    class Text(str):
+        pass
+    
+    for value in ["hello", "é \"q\"\n", "", Text("sub"), 42, True, None]:
+        assert hash_canonical(value) == sha256_hex(canonicalize(value))
+    # A string and the JSON text of its literal are different values
+    assert hash_canonical("1") != hash_canonical(1)
+
+
 def test_hash_canonical_complex():
     """hash_canonical works with complex nested structures."""
     value = {
@@ -68,3 +89,20 @@ def test_hash_canonical_key_order_invariant():
     hash2 = hash_canonical(dict2)
     
     assert hash1 == hash2
+
+
+def test_hash_canonical_streaming_matches():
+    """Streaming hash equals hash_canonical, including multi-chunk values."""
+    small = {"b": [1, 2.5, None, True], "a": "caf\u00e9"}
+    large = {f"module_{i:05d}": {"hash": "ab" * 32, "deps": list(range(5))}
+             for i in range(3000)}
+    
+    for value in (small, large, "x", 0, []):
+        expected = sha256_hex(canonicalize(value))
+        assert hash_canonical_streaming(value) == expected
+        assert hash_canonical(value) == expected
+    
+    chunks = []
+    canonicalize_into(large, chunks.append)
+    assert len(chunks) > 1
+    assert b"".join(chunks) == canonicalize(large)
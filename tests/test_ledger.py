@@ -1,10 +1,34 @@
 """Tests for the evidence ledger."""
 
+import pytest
+
 from motherlabs_kernel.ledger import Ledger
-from motherlabs_kernel.ledger_types import EvidenceRecord
+from motherlabs_kernel.ledger_types import EvidenceRecord, compute_record_hash
 from motherlabs_kernel.ledger_validate import validate_chain
 from motherlabs_kernel.hash import hash_canonical
 
+# Pinned digests (see test_pinned_digests_match_hash_canonical)
+SEED_TEST_PAYLOAD_HASH = "6ff0c5da0d5fe06c32ab703f14bebf9d96030e30f017a23c5832650ee0233ef0"
+DATA_VALUE_PAYLOAD_HASH = "0e89816213d1e462482311a16310424a2cbc5aeea79f7213934d087d97f8b763"
+# record_hash of v=1, ts="T000001", kind="test", parent=None over DATA_VALUE_PAYLOAD_HASH
+DATA_VALUE_RECORD_HASH = "598d84a696570b3b62f96b91dfa9000bd4ac3e6cf8b9d67b2a35e1438a0e8a62"
+
+# (ts, kind, payload) sequence for the reference three-record chain
+CHAIN_ENTRIES = (
+    ("T000001", "seedpack", {"seed": "test1"}),
+    ("T000002", "proposal", {"proposal": "data"}),
+    ("T000003", "commit", {"commit": "value"}),
+)
+
+
+@pytest.fixture(scope="module")
+def reference_records():
+    """Records of one Ledger built from CHAIN_ENTRIES (records are frozen)."""
+    ledger = Ledger()
+    for entry in CHAIN_ENTRIES:
+        ledger.append(*entry)
+    return tuple(ledger.get_records())
+
 
 def test_ledger_append_first_record():
     """Appending first record creates correct hash chain."""
@@ -16,7 +40,7 @@ def test_ledger_append_first_record():
     assert record.kind == "seedpack"
     assert record.parent is None
     assert record.payload == {"seed": "test"}
-    assert record.payload_hash == hash_canonical({"seed": "test"})
+    assert record.payload_hash == SEED_TEST_PAYLOAD_HASH
     assert len(ledger) == 1
 
 
@@ -39,24 +63,25 @@ def test_ledger_record_hash_independent_of_payload():
     """record_hash does not depend on full payload, only payload_hash."""
     ledger = Ledger()
     
-    # Same payload should produce same payload_hash
-    payload = {"data": "value"}
-    payload_hash = hash_canonical(payload)
-    
-    record1 = ledger.append("T000001", "test", payload)
+    record1 = ledger.append("T000001", "test", {"data": "value"})
     
-    # record_hash should be computed from metadata only
-    record_metadata = {
+    # record_hash is the hash of the metadata only (v, ts, kind, parent,
+    # payload_hash), pinned as DATA_VALUE_RECORD_HASH
+    assert record1.record_hash == DATA_VALUE_RECORD_HASH
+    assert record1.payload_hash == DATA_VALUE_PAYLOAD_HASH
+
+
+def test_pinned_digests_match_hash_canonical():
+    """The pinned digests above are hash_canonical of the payload / metadata dicts."""
+    assert hash_canonical({"seed": "test"}) == SEED_TEST_PAYLOAD_HASH
+    assert hash_canonical({"data": "value"}) == DATA_VALUE_PAYLOAD_HASH
+    assert hash_canonical({
         "v": 1,
         "ts": "T000001",
         "kind": "test",
         "parent": None,
-        "payload_hash": payload_hash
-    }
-    expected_record_hash = hash_canonical(record_metadata)
-    
-    assert record1.record_hash == expected_record_hash
-    assert record1.payload_hash == payload_hash
+        "payload_hash": DATA_VALUE_PAYLOAD_HASH
+    }) == DATA_VALUE_RECORD_HASH
 
 
 def test_ledger_get_last_hash():
@@ -150,27 +175,97 @@ def test_ledger_determinism_fixed_ts_payload():
     assert record1.record_hash == record2.record_hash
 
 
-def test_ledger_determinism_chain():
+def test_ledger_determinism_chain(reference_records):
     """Full chain is deterministic given fixed sequence of inputs."""
-    ledger1 = Ledger()
-    ledger1.append("T000001", "seedpack", {"seed": "test1"})
-    ledger1.append("T000002", "proposal", {"proposal": "data"})
-    ledger1.append("T000003", "commit", {"commit": "value"})
-    
     ledger2 = Ledger()
-    ledger2.append("T000001", "seedpack", {"seed": "test1"})
-    ledger2.append("T000002", "proposal", {"proposal": "data"})
-    ledger2.append("T000003", "commit", {"commit": "value"})
-    
-    records1 = ledger1.get_records()
+    for entry in CHAIN_ENTRIES:
+        ledger2.append(*entry)
     records2 = ledger2.get_records()
     
     # All hashes should match
-    for r1, r2 in zip(records1, records2):
-        assert r1.payload_hash == r2.payload_hash
-        assert r1.record_hash == r2.record_hash
-        assert r1.parent == r2.parent
+    assert len(records2) == len(reference_records)
+    assert [(r.payload_hash, r.record_hash, r.parent) for r in reference_records] == \
+        [(r.payload_hash, r.record_hash, r.parent) for r in records2]
     
     # Both chains should validate
-    assert validate_chain(records1) is True
+    assert validate_chain(reference_records) is True
     assert validate_chain(records2) is True
+
+
+def test_validate_chain_shallow_trusts_payload_hash():
+    """deep=False skips payload rehashing but still checks record hashes."""
+    ledger = Ledger()
+    ledger.append("T000001", "seedpack", {"seed": "test1"})
+    ledger.append("T000002", "proposal", {"proposal": "data"})
+    records = ledger.get_records()
+    assert validate_chain(records, deep=False) is True
+    
+    swapped_payload = EvidenceRecord(
+        v=records[0].v, ts=records[0].ts, kind=records[0].kind,
+        parent=records[0].parent, payload={"seed": "MUTATED"},
+        payload_hash=records[0].payload_hash, record_hash=records[0].record_hash
+    )
+    assert validate_chain([swapped_payload] + records[1:], deep=False) is True
+    assert validate_chain([swapped_payload] + records[1:]) is False
+    
+    wrong_ts = EvidenceRecord(
+        v=records[0].v, ts="T999999", kind=records[0].kind,
+        parent=records[0].parent, payload=records[0].payload,
+        payload_hash=records[0].payload_hash, record_hash=records[0].record_hash
+    )
+    assert validate_chain([wrong_ts] + records[1:], deep=False) is False
+
+
+def test_compute_record_hash_matches_canonical_metadata():
+    """Specialized record-hash encoding equals hash_canonical of the metadata dict."""
+    for parent in (None, "ab" * 32, 'quo"te'):
+        for ts, kind in (("T000001", "seedpack"), ("café\n", "k\\ind")):
+            expected = hash_canonical({
+                "v": 1, "ts": ts, "kind": kind, "parent": parent, "payload_hash": "cd" * 32
+            })
+            assert compute_record_hash(1, ts, kind, parent, "cd" * 32) == expected
+    # bool v is not an int for canonical JSON; falls back to the generic path
+    assert compute_record_hash(True, "T", "k", None, "h") == hash_canonical(
+        {"v": True, "ts": "T", "kind": "k", "parent": None, "payload_hash": "h"}
+    )
+
+
+def test_ledger_iteration_without_copy():
+    """iter_records()/__iter__ yield the same records as get_records()."""
+    ledger = Ledger()
+    ledger.append("T000001", "seedpack", {"seed": "test1"})
+    ledger.append("T000002", "proposal", {"proposal": "data"})
+    
+    assert list(ledger.iter_records()) == ledger.get_records()
+    assert [r.record_hash for r in ledger] == [r.record_hash for r in ledger.get_records()]
+
+
+def test_ledger_extend_matches_append():
+    """extend() builds the same chain as successive append() calls."""
+    entries = [
+        ("T000001", "seedpack", {"seed": "test"}),
+        ("T000002", "proposal", {"data": [1, 2]}),
+        ("T000003", "commit", {"ok": True}),
+    ]
+    appended = Ledger()
+    appended.append(*entries[0])
+    for entry in entries[1:]:
+        appended.append(*entry)
+    
+    extended = Ledger()
+    extended.append(*entries[0])
+    new_records = extended.extend(entries[1:])
+    
+    assert new_records == extended.get_records()[1:]
+    assert extended.get_records() == appended.get_records()
+    assert validate_chain(extended.get_records())
+    assert extended.extend([]) == []
+
+
+def test_ledger_iter_record_hashes():
+    """iter_record_hashes yields each record_hash in order."""
+    ledger = Ledger()
+    assert list(ledger.iter_record_hashes()) == []
+    ledger.append("T000001", "seedpack", {"seed": "test"})
+    ledger.append("T000002", "proposal", {"data": "value"})
+    assert list(ledger.iter_record_hashes()) == [r.record_hash for r in ledger.get_records()]
@@ -1,10 +1,20 @@
 """Tests for policy validation and tie-breaking."""
 
+import dataclasses
+
 import pytest
 
 from motherlabs_kernel.policy import tie_break, validate_policy
 from motherlabs_kernel.policy_types import Policy
 
+VALID_POLICY_KWARGS = {
+    "max_interpretations": 3,
+    "max_nodes": 100,
+    "max_depth": 10,
+    "contradiction_budget": 5,
+    "max_steps": 50,
+}
+
 
 def test_validate_policy_valid():
     """Valid policy passes validation."""
@@ -19,82 +29,37 @@ def test_validate_policy_valid():
     validate_policy(policy)
 
 
-def test_validate_policy_max_interpretations_invalid():
-    """max_interpretations < 1 raises ValueError."""
-    policy = Policy(
-        max_interpretations=0,
-        max_nodes=100,
-        max_depth=10,
-        contradiction_budget=5,
-        max_steps=50
-    )
-    with pytest.raises(ValueError, match="max_interpretations"):
-        validate_policy(policy)
-
-
-def test_validate_policy_max_nodes_invalid():
-    """max_nodes < 1 raises ValueError."""
-    policy = Policy(
-        max_interpretations=3,
-        max_nodes=0,
-        max_depth=10,
-        contradiction_budget=5,
-        max_steps=50
-    )
-    with pytest.raises(ValueError, match="max_nodes"):
-        validate_policy(policy)
-
-
-def test_validate_policy_max_depth_invalid():
-    """max_depth < 1 raises ValueError."""
-    policy = Policy(
-        max_interpretations=3,
-        max_nodes=100,
-        max_depth=0,
-        contradiction_budget=5,
-        max_steps=50
-    )
-    with pytest.raises(ValueError, match="max_depth"):
-        validate_policy(policy)
-
-
-def test_validate_policy_contradiction_budget_invalid():
-    """contradiction_budget < 0 raises ValueError."""
-    policy = Policy(
-        max_interpretations=3,
-        max_nodes=100,
-        max_depth=10,
-        contradiction_budget=-1,
-        max_steps=50
-    )
-    with pytest.raises(ValueError, match="contradiction_budget"):
-        validate_policy(policy)
-
-
-def test_validate_policy_max_steps_invalid():
-    """max_steps < 1 raises ValueError."""
-    policy = Policy(
-        max_interpretations=3,
-        max_nodes=100,
-        max_depth=10,
-        contradiction_budget=5,
-        max_steps=0
-    )
-    with pytest.raises(ValueError, match="max_steps"):
-        validate_policy(policy)
-
-
-def test_validate_policy_tiebreak_invalid():
-    """Invalid tiebreak method raises ValueError."""
+def test_policy_is_frozen_slotted_and_hashable():
+    """Policy is immutable, has no instance __dict__, and hashes by value."""
     policy = Policy(
         max_interpretations=3,
         max_nodes=100,
         max_depth=10,
         contradiction_budget=5,
-        max_steps=50,
-        deterministic_tiebreak='invalid'  # type: ignore
+        max_steps=50
     )
-    with pytest.raises(ValueError, match="deterministic_tiebreak"):
+    same = Policy(3, 100, 10, 5, 50)
+    
+    assert not hasattr(policy, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        policy.max_nodes = 1  # type: ignore[misc]
+    # Usable as a cache key for per-policy memoization
+    assert hash(policy) == hash(same)
+    assert {policy: "cached"}[same] == "cached"
+
+
+@pytest.mark.parametrize("field,value", [
+    ("max_interpretations", 0),      # max_interpretations < 1
+    ("max_nodes", 0),                # max_nodes < 1
+    ("max_depth", 0),                # max_depth < 1
+    ("contradiction_budget", -1),    # contradiction_budget < 0
+    ("max_steps", 0),                # max_steps < 1
+    ("deterministic_tiebreak", "invalid"),
+])
+def test_validate_policy_field_invalid(field, value):
+    """An out-of-range field raises ValueError naming that field."""
+    policy = Policy(**{**VALID_POLICY_KWARGS, field: value})
+    with pytest.raises(ValueError, match=field):
         validate_policy(policy)
 
 
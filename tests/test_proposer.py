@@ -3,6 +3,7 @@
 import pytest
 
 from motherlabs_kernel.ambiguity_types import Interpretation
+from motherlabs_kernel.proposal_types import Proposal
 from motherlabs_kernel.proposer_null import NullProposer
 from motherlabs_kernel.proposer_recorded import RecordedProposer
 
@@ -70,3 +71,29 @@ def test_recorded_proposer_deterministic():
     assert proposal1.proposal_hash == proposal2.proposal_hash
     assert len(proposal1.value) == len(proposal2.value) == 3
     assert proposal1.value[0].name == proposal2.value[0].name
+
+
+def test_recorded_proposer_caches_proposal():
+    """RecordedProposer reuses a key's interpretations and hash, not its Proposal."""
+    recordings = {
+        "interpretations:seed1:2": [
+            {"name": "A", "assumptions": ["a"], "intent_summary": "sum1"},
+            {"name": "B", "assumptions": ["b"], "intent_summary": "sum2"},
+        ]
+    }
+    proposer = RecordedProposer(recordings)
+    
+    proposal = proposer.propose_interpretations("seed1", 2)
+    again = proposer.propose_interpretations("seed1", 2)
+    assert again is not proposal and again.value is not proposal.value
+    assert again == proposal
+    assert all(a is b for a, b in zip(again.value, proposal.value))
+    
+    # Mutating one caller's value does not reach later callers
+    proposal.value.clear()
+    later = proposer.propose_interpretations("seed1", 2)
+    assert [i.name for i in later.value] == ["A", "B"]
+    assert later.proposal_hash == Proposal.create("heuristic", later.value).proposal_hash
+    assert proposal.proposal_hash == RecordedProposer(recordings).propose_interpretations(
+        "seed1", 2
+    ).proposal_hash
@@ -9,20 +9,33 @@ from motherlabs_kernel.proposal_types import Proposal
 from motherlabs_kernel.refusal import check_refusal_conditions, generate_policy_suggestions
 from motherlabs_kernel.run_engine import run_engine
 
+# Stateless / frozen objects shared across tests
+NULL_PROPOSER = NullProposer()
+SINGLE_INTERP = Interpretation(name="A", assumptions=[], intent_summary="test")
+SMALL_POLICY = Policy(
+    max_interpretations=1,
+    max_nodes=10,
+    max_depth=5,
+    contradiction_budget=0,
+    max_steps=10
+)
+# Limits the threshold tests lower one at a time
+BASE_POLICY_KWARGS = {
+    "max_interpretations": 1,
+    "max_nodes": 100,
+    "max_depth": 10,
+    "contradiction_budget": 0,
+    "max_steps": 50,
+}
+
 
 def test_empty_proposal_triggers_refusal():
     """Empty proposal triggers refusal artifact."""
     run_id = "test_refusal_001"
     seed_text = "Build something"
     pin = {}
-    policy = Policy(
-        max_interpretations=1,
-        max_nodes=10,
-        max_depth=5,
-        contradiction_budget=0,
-        max_steps=10
-    )
-    proposer = NullProposer()  # Returns empty list
+    policy = SMALL_POLICY
+    proposer = NULL_PROPOSER  # Returns empty list
     
     result = run_engine(run_id, seed_text, pin, policy, proposer, "T000000", step_ms=1)
     
@@ -65,15 +78,9 @@ def test_contradictions_exceed_budget():
 
 def test_max_nodes_exceeded():
     """Max nodes exceeded triggers refusal."""
-    policy = Policy(
-        max_interpretations=1,
-        max_nodes=5,  # Low limit
-        max_depth=10,
-        contradiction_budget=0,
-        max_steps=50
-    )
+    policy = Policy(**{**BASE_POLICY_KWARGS, "max_nodes": 5})  # Low limit
     
-    proposal = Proposal.create("heuristic", [Interpretation(name="A", assumptions=[], intent_summary="test")])
+    proposal = Proposal.create("heuristic", [SINGLE_INTERP])
     
     reasons = check_refusal_conditions(proposal, policy, step_count=1, node_count=10, interpretations=[])
     
@@ -82,15 +89,9 @@ def test_max_nodes_exceeded():
 
 def test_max_steps_exceeded():
     """Max steps exceeded triggers refusal."""
-    policy = Policy(
-        max_interpretations=1,
-        max_nodes=100,
-        max_depth=10,
-        contradiction_budget=0,
-        max_steps=5  # Low limit
-    )
+    policy = Policy(**{**BASE_POLICY_KWARGS, "max_steps": 5})  # Low limit
     
-    proposal = Proposal.create("heuristic", [Interpretation(name="A", assumptions=[], intent_summary="test")])
+    proposal = Proposal.create("heuristic", [SINGLE_INTERP])
     
     reasons = check_refusal_conditions(proposal, policy, step_count=10, node_count=0, interpretations=[])
     
@@ -104,14 +105,8 @@ def test_replay_reproduces_refusal_summary_hash():
     run_id = "test_refusal_replay"
     seed_text = "Test"
     pin = {}
-    policy = Policy(
-        max_interpretations=1,
-        max_nodes=10,
-        max_depth=5,
-        contradiction_budget=0,
-        max_steps=10
-    )
-    proposer = NullProposer()
+    policy = SMALL_POLICY
+    proposer = NULL_PROPOSER
     
     result = run_engine(run_id, seed_text, pin, policy, proposer, "T000000", step_ms=1)
     
@@ -132,3 +127,18 @@ def test_policy_suggestions_generated():
     
     assert len(suggestions) > 0
     assert all(isinstance(s, str) for s in suggestions)
+
+
+def test_policy_suggestions_by_reason_name():
+    """Suggestions are looked up by reason name; unknown codes are skipped."""
+    reasons = [
+        "contradictions_exceeded:7>5",
+        "resolve_ambiguity_failed",
+        "max_steps_exceeded:51>50",
+        "empty_proposal",
+    ]
+    assert generate_policy_suggestions(reasons) == [
+        "Increase contradiction_budget or reduce assumption overlap",
+        "Increase max_steps or reduce exploration depth",
+        "Increase proposer output or check proposer configuration",
+    ]
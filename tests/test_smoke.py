@@ -4,3 +4,13 @@
 def test_smoke():
     """Trivial passing test to verify pytest runs."""
     assert True
+
+
+def test_public_exports_resolve():
+    """Every name in __all__ resolves through the lazy package exports."""
+    import motherlabs_kernel
+    from motherlabs_kernel.hash import hash_canonical
+    
+    for name in motherlabs_kernel.__all__:
+        assert getattr(motherlabs_kernel, name) is not None
+    assert motherlabs_kernel.hash_canonical is hash_canonical